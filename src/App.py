@@ -1,8 +1,8 @@
 import tkinter as tk
 import os
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, ttk
 from ttkthemes import ThemedTk
-import CDMvalidator
 
 
 # fix identifier errors
@@ -12,10 +12,16 @@ class App:
         self.root = ThemedTk(theme="clearlooks")
         self.root.geometry("250x250")
         self.root.title("CDM Validator")
+        # paths already confirmed to be files, so re-selecting them skips the stat call
+        self._validated_paths: set[str] = set()
 
     def select_solution_file(self):
         self.solution_path = filedialog.askopenfilename()
-        if not os.path.isfile(self.solution_path):
+        if self.solution_path in self._validated_paths:
+            return
+        if os.path.isfile(self.solution_path):
+            self._validated_paths.add(self.solution_path)
+        else:
             print("Invalid file selected.")
 
     def normal_verification(self):
@@ -24,6 +30,13 @@ class App:
     def batch_verification(self):
         self.src_path = filedialog.askdirectory()
 
+    # yields the .cdm files in the selected folder, scandir entries cache the file type so no extra stat is needed
+    def _iter_batch_files(self):
+        with os.scandir(self.src_path) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith(".cdm"):
+                    yield entry.path
+
     def src_filename_selection(self):
         if self.validation_mode.get() == "normal":
             self.normal_verification()
@@ -31,17 +44,44 @@ class App:
             self.batch_verification()
 
     def verify(self):
+        # imported here so the parsing and rendering modules only load once Run is pressed
+        import CDMvalidator
+
+        if self.validation_mode.get() == "batch":
+            self.verify_batch(CDMvalidator)
+            return
+
         try:
             if self.export_var.get() == "SVG":
-                if self.validation_mode.get() == "normal":
-                    CDMvalidator.normal_validation_mode(self.src_path, self.solution_path, "SVG")
-                else:
-                    CDMvalidator.batch_verification_mode(self.src_path, self.solution_path, "SVG")
+                CDMvalidator.normal_validation_mode(self.src_path, self.solution_path, "SVG")
             elif self.export_var.get() == "PNG":
-                if self.validation_mode.get() == "normal":
-                    CDMvalidator.normal_validation_mode(self.src_path, self.solution_path, "PNG")
-                else:
-                    CDMvalidator.batch_verification_mode(self.src_path, self.solution_path, "PNG")
+                CDMvalidator.normal_validation_mode(self.src_path, self.solution_path, "PNG")
+        except Exception as e:
+            print(f"An error occurred during verification: {e}")
+
+        finally:
+            print("Verification complete.")
+            self.root.destroy()
+
+    def verify_batch(self, CDMvalidator):
+        # the files are validated in worker processes started from a background thread, the window stays responsive
+        # and polls for the result
+        self.export_button.state(["disabled"])
+        puml_mode = self.export_var.get()
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.batch_future = executor.submit(
+            lambda: CDMvalidator.batch_verification_mode(self.src_path, self.solution_path, puml_mode,
+                                                         list(self._iter_batch_files())))
+        executor.shutdown(wait=False)
+        self.root.after(100, self.poll_batch)
+
+    def poll_batch(self):
+        if not self.batch_future.done():
+            self.root.after(100, self.poll_batch)
+            return
+
+        try:
+            self.batch_future.result()
         except Exception as e:
             print(f"An error occurred during verification: {e}")
 
@@ -50,28 +90,29 @@ class App:
             self.root.destroy()
 
     def run(self):
-        self.solution_button = ttk.Button(self.root, text="Select Solution File", command=self.select_solution_file)
-        self.solution_button.pack(pady=5)
+        # all widgets are children of one frame and laid out with grid, so the geometry is computed once
+        self.frame = ttk.Frame(self.root)
+        self.frame.pack(fill="both", expand=True)
+        self.frame.columnconfigure(0, weight=1)
 
-        self.validation_mode = tk.StringVar(value="normal")
-        self.normal_radio = ttk.Radiobutton(self.root, text="Normal Validation", variable=self.validation_mode, value="normal")
-        self.normal_radio.pack(pady=5)
+        self.solution_button = ttk.Button(self.frame, text="Select Solution File", command=self.select_solution_file)
 
-        self.batch_radio = ttk.Radiobutton(self.root, text="Batch Validation", variable=self.validation_mode, value="batch")
-        self.batch_radio.pack(pady=5)
+        self.validation_mode = tk.StringVar(value="normal")
+        self.normal_radio = ttk.Radiobutton(self.frame, text="Normal Validation", variable=self.validation_mode, value="normal")
+        self.batch_radio = ttk.Radiobutton(self.frame, text="Batch Validation", variable=self.validation_mode, value="batch")
 
-        self.src_button = ttk.Button(self.root, text="Select source file / folder", command=self.src_filename_selection)
-        self.src_button.pack(pady=5)
+        self.src_button = ttk.Button(self.frame, text="Select source file / folder", command=self.src_filename_selection)
 
         self.export_var = tk.StringVar(value="PNG")
-        self.png_radio = ttk.Radiobutton(self.root, text="Export PNG", variable=self.export_var, value="PNG")
-        self.png_radio.pack(pady=5)
+        self.png_radio = ttk.Radiobutton(self.frame, text="Export PNG", variable=self.export_var, value="PNG")
+        self.svg_radio = ttk.Radiobutton(self.frame, text="Export SVG", variable=self.export_var, value="SVG")
 
-        self.svg_radio = ttk.Radiobutton(self.root, text="Export SVG", variable=self.export_var, value="SVG")
-        self.svg_radio.pack(pady=5)
+        self.export_button = ttk.Button(self.frame, text="Run", command=self.verify)
 
-        self.export_button = ttk.Button(self.root, text="Run", command=self.verify)
-        self.export_button.pack(pady=5)
+        for row, widget in enumerate((self.solution_button, self.normal_radio, self.batch_radio, self.src_button,
+                                      self.png_radio, self.svg_radio, self.export_button)):
+            widget.grid(row=row, column=0, pady=5)
+        self.frame.update_idletasks()
 
         self.root.mainloop()
 
@@ -2,9 +2,11 @@
 CDMmodel.py is a representation of the Conceptual Data Models (CDM) in the form of a class template.
 The class template is used in the CDMParser class to store the information extracted from the input CDM file (XML)
 '''
+import functools
+from types import MappingProxyType
 
 # used for translating the datatype codes to human-readable form
-datatypes = {
+datatypes = MappingProxyType({
     "I": "Integer",
     "SI": "Short Integer",
     "LI": "Long Integer",
@@ -34,12 +36,71 @@ datatypes = {
     "PIC": "Image",
     "OLE": "OLE Object",
     None: "Undefined"
-}
+})
+# datatype codes are a small fixed set, so they are resolved to an index into the tuple of names at parse time
+_DATATYPE_CODE_TO_IDX = {code: i for i, code in enumerate(datatypes)}
+_DATATYPE_NAMES = tuple(datatypes.values())
+_UNDEFINED_DATATYPE_IDX = _DATATYPE_CODE_TO_IDX[None]
+
+
+def _memoize_puml(puml):
+    """
+    Cache the rendered PlantUML string of a model object per style. The model objects don't change after parsing,
+    so the output of puml() only depends on the styles passed in.
+    """
+    @functools.wraps(puml)
+    def wrapper(self, *styles):
+        try:
+            return self._puml_cache[styles]
+        except KeyError:
+            ret = self._puml_cache[styles] = puml(self, *styles)
+            return ret
+
+    return wrapper
+
+
+# used for mapping the relationship cardinalities to their visual representation in PlantUML
+_CARD21 = MappingProxyType({
+    '0,1': '|o',
+    '1,1': '||',
+    '1,n': '}|',
+    '0,n': '}o',
+})
+_CARD12 = MappingProxyType({
+    '0,1': 'o|',
+    '1,1': '||',
+    '1,n': '|{',
+    '0,n': 'o{',
+})
+
+# templates of the PlantUML lines, filled in with %-formatting
+_ENTITY_HEADER = 'entity "%s" as %s %s {'
+_ENTITY_ATTRIBUTE_LINE = '\n\t* %s : %s %s %s %s %s'
+_ASSOCIATION_ATTRIBUTE_LINE = '\n\t* %s : %s %s %s %s'
+_ENTITY_IDENTIFIERS_SEPARATOR = ' \n\t --'
+_IDENTIFIER_LINE = '\n\t* %s %s'
+_ENTITY_FOOTER = '\n}'
+_RELATIONSHIP_LINE = '%s %s %s: %s \n'
+
+
+@functools.lru_cache(maxsize=256)
+def _rel_symbols(cardinality_1to2: str, cardinality_2to1: str, dependent: bool, style_str: str) -> str:
+    """
+    Build the PlantUML connector between the two entities of a relationship. There are only a few cardinality
+    combinations, so the result is cached.
+    """
+    # if the relationship is dependent, a dotted line is used to represent the dependency, otherwise straight
+    # line is used
+    line = '.' if dependent else '-'
+    return f'{_CARD21[cardinality_2to1]}{line}[{style_str}]{line}{_CARD12[cardinality_1to2]}'
 
 
 class Model:
+    __slots__ = ('id', 'name', 'code', 'entities', 'relationships', 'inheritances', 'domains', 'associations',
+                 'association_links', 'packages', '_entities_by_id', '_joined_cache')
+
     def __init__(self, id, name, code, entities, inheritances, relationships, associations, association_links, domains,
-                 packages=None):
+                 packages=None) -> None:
         self.id = id
         self.name = name
         self.code = code
@@ -50,39 +111,72 @@ class Model:
         self.associations: list[Association] = associations
         self.association_links: list[AssociationLink] = association_links
         self.packages: list[Package] = packages if packages is not None else []
+        # index of the entities by id, used by the lookup methods below
+        self._entities_by_id: dict[str, Entity] = {entity.id: entity for entity in self.entities}
+        self._joined_cache: dict[str, str] = {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.id}:{self.name})"
 
     def __str__(self):
-        return (f"Model ({self.id}): {self.name}\n\t"
-                f"Entities: {[entity.name for entity in self.entities]} \n\t"
-                f"Inheritances: \n\t\t{'\n\t\t'.join([str(inheritance) for inheritance in self.inheritances])} \n\t"
-                f"Relationships: \n\t\t{'\n\t\t'.join([str(relationship) for relationship in self.relationships])} \n\t"
-                f"Associations: {[ass.name for ass in self.associations]}\n\t"
-                f"Association links: \n\t\t{'\n\t\t'.join([str(link) for link in self.association_links])} \n\t"
-                f"Domains: \n\t\t {'\n\t\t'.join([str(domain) for domain in self.domains])} \n\t"
-                f"Packages: \n\t\t {'\n\t\t'.join([package.name for package in self.packages])}")
+        ret_str = (f"{type(self).__name__} ({self.id}): {self.name}\n\t"
+                   f"Entities: {[entity.name for entity in self.entities]} \n\t"
+                   f"Inheritances: \n\t\t{self._joined('inheritances')} \n\t"
+                   f"Relationships: \n\t\t{self._joined('relationships')} \n\t"
+                   f"Associations: {[ass.name for ass in self.associations]}\n\t"
+                   f"Association links: \n\t\t{self._joined('association_links')} \n\t"
+                   f"Domains: \n\t\t {self._joined('domains')}")
+        # packages are not nested, so only the main model lists them
+        if not isinstance(self, Package):
+            ret_str += f" \n\tPackages: \n\t\t {'\n\t\t'.join([package.name for package in self.packages])}"
+        return ret_str
+
+    def _joined(self, key):
+        """
+                Join the string representations of one of the model collections, the result is cached per collection.
+
+                :param key: The name of the collection attribute.
+                :return: The joined string.
+        """
+        if key not in self._joined_cache:
+            self._joined_cache[key] = '\n\t\t'.join(map(str, getattr(self, key)))
+        return self._joined_cache[key]
 
     def get_tables(self):
         return self.entities
 
+    def add_entity(self, entity):
+        """
+                Add an entity to the model and keep the id index in sync.
+
+                :param entity: The entity to be added.
+        """
+        self.entities.append(entity)
+        self._entities_by_id[entity.id] = entity
+        self._joined_cache.clear()
+
+    def get_entity_by_id(self, table_id):
+        return self._entities_by_id.get(table_id)
+
     def get_table_name_by_id(self, table_id):
-        for entity in self.entities:
-            if entity.id == table_id:
-                return entity.name
-        return None
+        entity = self._entities_by_id.get(table_id)
+        return entity.name if entity else None
 
     def get_attributes(self, table_id):
-        for entity in self.entities:
-            if entity.id == table_id:
-                return entity.attributes
+        entity = self._entities_by_id.get(table_id)
+        return entity.attributes if entity else None
 
     def get_identifiers(self, table_id):
-        for entity in self.entities:
-            if entity.id == table_id:
-                return entity.identifiers
+        entity = self._entities_by_id.get(table_id)
+        return entity.identifiers if entity else None
 
 
 class Entity:
-    def __init__(self, id, name, code, attributes, identifiers, relationships=None, links=None):
+    __slots__ = ('id', 'name', 'code', 'is_child', 'attributes', 'identifiers', 'relationships', 'association_links',
+                 'attr_names', 'attr_datatypes', 'attr_lengths', 'attr_precisions', 'attr_mandatory', 'attr_is_pk',
+                 '_puml_cache')
+
+    def __init__(self, id, name, code, attributes, identifiers, relationships=None, links=None) -> None:
         self.id = id
         self.name = name
         self.code = code
@@ -91,6 +185,28 @@ class Entity:
         self.identifiers: list[Identifier] = identifiers
         self.relationships: list[Relationship] = relationships if relationships is not None else []
         self.association_links: list[AssociationLink] = links if links is not None else []
+        self._puml_cache: dict[tuple, str] = {}
+        self.build_attribute_columns()
+
+    def build_attribute_columns(self):
+        """
+                Store the attribute fields used when rendering the entity as parallel tuples.
+                Must be called again if the attributes or identifiers are changed after construction.
+        """
+        # ids of the attributes that are part of a primary identifier
+        primary_attributes = {id(attribute) for ident in self.identifiers if ident.is_primary
+                              for attribute in ident.identifier_attributes}
+
+        self.attr_names = tuple(attribute.name for attribute in self.attributes)
+        self.attr_datatypes = tuple(attribute.datatype_str for attribute in self.attributes)
+        self.attr_lengths = tuple(attribute.length for attribute in self.attributes)
+        self.attr_precisions = tuple(attribute.precision for attribute in self.attributes)
+        self.attr_mandatory = tuple(attribute.mandatory for attribute in self.attributes)
+        self.attr_is_pk = tuple(id(attribute) in primary_attributes for attribute in self.attributes)
+        self._puml_cache.clear()
+
+    def __repr__(self):
+        return f"Entity({self.id}:{self.name})"
 
     def __str__(self):
         return (f"Entity({self.id}): {self.name} \n\t"
@@ -99,154 +215,188 @@ class Entity:
                 f"\n\t Relationships: \n\t\t{'\n\t\t'.join([str(relationship) for relationship in self.relationships])}"
                 f"\n\t Association links: \n\t\t{'\n\t\t'.join([str(link) for link in self.association_links])}")
 
-    def puml(self, style_str):
-        def resolve_primary_identifier_attributes(attribute):
-            for ident in self.identifiers:
-                if attribute in ident.identifier_attributes and ident.is_primary:
-                    return True
-            return False
-
-        ret_str = f'entity "{self.name}" as {self.id} {style_str} ' + "{"
-        for attribute in self.attributes:
-            ret_str += f'\n\t* {attribute.name} : {datatypes[attribute.datatype]} {[attribute.length if attribute.length else ''][0]} {[attribute.precision if attribute.precision else ''][0]} {'MANDATORY' if attribute.mandatory else ''} {'PRIMARY KEY' if resolve_primary_identifier_attributes(attribute) else ''}'
-        ret_str += " \n\t --"
+    @_memoize_puml
+    def puml(self, style_str: str) -> str:
+        parts: list[str] = [_ENTITY_HEADER % (self.name, self.id, style_str)]
+        for name, datatype, length, precision, mandatory, is_pk in zip(self.attr_names, self.attr_datatypes,
+                                                                       self.attr_lengths, self.attr_precisions,
+                                                                       self.attr_mandatory, self.attr_is_pk):
+            parts.append(_ENTITY_ATTRIBUTE_LINE % (name, datatype, length or '', precision or '',
+                                                   'MANDATORY' if mandatory else '', 'PRIMARY KEY' if is_pk else ''))
+        parts.append(_ENTITY_IDENTIFIERS_SEPARATOR)
         for identifier in self.identifiers:
-            ret_str += f'\n\t* {identifier.name} {'PRIMARY KEY' if identifier.is_primary else ''}'
+            parts.append(_IDENTIFIER_LINE % (identifier.name, 'PRIMARY KEY' if identifier.is_primary else ''))
 
-        ret_str += "\n}"
+        parts.append(_ENTITY_FOOTER)
 
-        return ret_str
+        return "".join(parts)
 
 
 class Attribute:
-    def __init__(self, id, name, code, mandatory, domain, datatype, length=None, precision=None):
+    __slots__ = ('id', 'name', 'code', 'mandatory', 'datatype', '_dt_idx', 'datatype_str', 'length', 'precision',
+                 'domain', '_str_cache')
+
+    def __init__(self, id, name, code, mandatory, domain, datatype, length=None, precision=None) -> None:
         self.id = id  # attributeID not dataItemID
         self.name = name
         self.code = code
         self.mandatory = mandatory
         self.datatype = datatype
+        self._dt_idx = _DATATYPE_CODE_TO_IDX.get(datatype, _UNDEFINED_DATATYPE_IDX)
+        self.datatype_str = _DATATYPE_NAMES[self._dt_idx]  # human-readable datatype, resolved once
         self.length = int(length) if length is not None else None
         self.precision = int(precision) if precision is not None else None
-        self.domain: Domain = domain
+        self.domain = domain
+        self._str_cache: str | None = None
+
+    def __repr__(self):
+        return f"Attribute({self.id}:{self.name})"
 
-def __str__(self):
-    return f"Attribute({self.id}): {self.name} - {self.datatype}{(self.length, self.precision) if self.length else ''} {'-> IN DOMAIN: ' + self.domain.name + ' ' if self.domain else ''}- {"MANDATORY" if self.mandatory else "not mandatory"}"
+    def __str__(self):
+        # attributes don't change after linking, so the formatted string is built only once
+        if self._str_cache is None:
+            self._str_cache = f"Attribute({self.id}): {self.name} - {self.datatype}{(self.length, self.precision) if self.length else ''} {'-> IN DOMAIN: ' + self.domain.name + ' ' if self.domain else ''}- {"MANDATORY" if self.mandatory else "not mandatory"}"
+        return self._str_cache
 
 
 class Identifier:
-    def __init__(self, identifierID, identifier_name, identifier_attributes, primary_identifier):
+    __slots__ = ('id', 'name', 'identifier_attributes', 'is_primary')
+
+    def __init__(self, identifierID, identifier_name, identifier_attributes, primary_identifier) -> None:
         self.id = identifierID
         self.name = identifier_name
         self.identifier_attributes = identifier_attributes
         self.is_primary = primary_identifier
 
+    def __repr__(self):
+        return f"Identifier({self.id}:{self.name})"
+
     def __str__(self):
         return f"Identifier({self.id}) {self.name} -> {''.join([str(attribute) for attribute in self.identifier_attributes])} - {"PRIMARY KEY" if self.is_primary else ''}"
 
 
 class Relationship:
+    __slots__ = ('id', 'name', 'code', 'is_dependent_e1', 'is_dependent_e2', 'entity1', 'entity2', 'cardinality_1to2',
+                 'cardinality_2to1', '_puml_cache')
+
     def __init__(self, id, name, code, dependent_e1, dependent_e2, entity1, entity2, cardinality_1to2,
-                 cardinality_2to1):
+                 cardinality_2to1) -> None:
         self.id = id
         self.name = name
         self.code = code
         self.is_dependent_e1 = dependent_e1
         self.is_dependent_e2 = dependent_e2
-        self.entity1: Entity = entity1
-        self.entity2: Entity = entity2
+        self.entity1 = entity1
+        self.entity2 = entity2
         self.cardinality_1to2 = cardinality_1to2
         self.cardinality_2to1 = cardinality_2to1
+        self._puml_cache: dict[tuple, str] = {}
+
+    def __repr__(self):
+        return f"Relationship({self.id}:{self.name})"
 
     def __str__(self):
         return (
             f"Relationship({self.id}): {self.name} || {self.entity1.name} {" Dependent" if self.is_dependent_e1 else ""} ({self.cardinality_1to2}) {self.entity2.name} <--> {self.entity2.name}{" Dependent" if self.is_dependent_e2 else ""} ({self.cardinality_2to1}) {self.entity1.name}")
 
-    def puml(self, style_str):
-        # Dictionaries to map cardinality values to their visual representation in PlantUML
-        cardinality21_visual = {
-            '0,1': '|o',
-            '1,1': '||',
-            '1,n': '}|',
-            '0,n': '}o',
-        }
-        cardinality12_visual = {
-            '0,1': 'o|',
-            '1,1': '||',
-            '1,n': '|{',
-            '0,n': 'o{',
-        }
-
-        # if the relationship is dependent, a dotted line is used to represent the dependency, otherwise straight
-        # line is used
-        if self.is_dependent_e1 or self.is_dependent_e2:
-            line = '.'
-        else:
-            line = '-'
-
-        ret_str = f'{self.entity2.id} {cardinality21_visual[self.cardinality_2to1]}{line}[{style_str}]{line}{cardinality12_visual[self.cardinality_1to2]} {self.entity1.id}: {self.name} \n'
+    @_memoize_puml
+    def puml(self, style_str: str) -> str:
+        ret_str = _RELATIONSHIP_LINE % (self.entity2.id,
+                                        _rel_symbols(self.cardinality_1to2, self.cardinality_2to1,
+                                                     self.is_dependent_e1 or self.is_dependent_e2, style_str),
+                                        self.entity1.id, self.name)
         return ret_str
 
 
 class Domain:
-    def __init__(self, id, name, code, datatype, length, precision):
+    __slots__ = ('id', 'name', 'code', 'datatype', '_dt_idx', 'datatype_str', 'length', 'precision')
+
+    def __init__(self, id, name, code, datatype, length, precision) -> None:
         self.id = id
         self.name = name
         self.code = code
         self.datatype = datatype
+        self._dt_idx = _DATATYPE_CODE_TO_IDX.get(datatype, _UNDEFINED_DATATYPE_IDX)
+        self.datatype_str = _DATATYPE_NAMES[self._dt_idx]  # human-readable datatype, resolved once
         self.length = int(length) if length is not None else None
         self.precision = int(precision) if precision is not None else None
 
+    def __repr__(self):
+        return f"Domain({self.id}:{self.name})"
+
     def __str__(self):
         return f"Domain({self.id}): {self.name} - {self.datatype} {(self.length, self.precision) if self.length else ''}"
 
 
 class Association:
-    def __init__(self, id, name, code, attributes, links=None):
+    __slots__ = ('id', 'name', 'code', 'attributes', 'association_links', '_puml_cache')
+
+    def __init__(self, id, name, code, attributes, links=None) -> None:
         self.id = id
         self.name = name
         self.code = code
         self.attributes: list[Attribute] = attributes
         self.association_links: list[AssociationLink] = links if links is not None else []
+        self._puml_cache: dict[tuple, str] = {}
+
+    def __repr__(self):
+        return f"Association({self.id}:{self.name})"
 
     def __str__(self):
         return (f"Association({self.id}): {self.name} \n\t"
                 f"Attributes: \n\t\t{'\n\t\t'.join([str(attribute) for attribute in self.attributes])}"
                 f"\n\t Association Links: \n\t\t{'\n\t\t'.join([str(association_link) for association_link in self.association_links])}")
 
-    def puml(self, style_str):
-        ret_str = f'entity "{self.name}" as {self.id} {style_str} ' + "{"
+    @_memoize_puml
+    def puml(self, style_str: str) -> str:
+        parts: list[str] = [_ENTITY_HEADER % (self.name, self.id, style_str)]
         for attribute in self.attributes:
-            ret_str += f'\n\t* {attribute.name} : {datatypes[attribute.datatype]} {[attribute.length if attribute.length else ''][0]} {[attribute.precision if attribute.precision else ''][0]} {'MANDATORY' if attribute.mandatory else ''}'
+            parts.append(_ASSOCIATION_ATTRIBUTE_LINE % (attribute.name, attribute.datatype_str, attribute.length or '',
+                                                        attribute.precision or '',
+                                                        'MANDATORY' if attribute.mandatory else ''))
 
-        ret_str += "\n}"
+        parts.append(_ENTITY_FOOTER)
 
-        return ret_str
+        return "".join(parts)
 
 
 class AssociationLink:
-    def __init__(self, id, association, entity, cardinality):
+    __slots__ = ('id', 'association', 'entity', 'cardinality', '_puml_cache')
+
+    def __init__(self, id, association, entity, cardinality) -> None:
         self.id = id
-        self.association: Association = association
-        self.entity: Entity = entity
+        self.association = association
+        self.entity = entity
         self.cardinality = cardinality
+        self._puml_cache: dict[tuple, str] = {}
+
+    def __repr__(self):
+        return f"AssociationLink({self.id})"
 
     def __str__(self):
         return f"Association Link({self.id}): {self.entity.name} ({self.cardinality}) {self.association.name}"
 
+    @_memoize_puml
     def puml(self, style_str):
         ret_str = f'{self.entity.id} "{self.cardinality}" -[{style_str}]- {self.association.id} \n'
         return ret_str
 
 
 class Inheritance:
-    def __init__(self, id, name, code, mutually_exclusive, complete, parent, children):
+    __slots__ = ('id', 'name', 'code', 'mutually_exclusive', 'complete', 'parent', 'children', '_puml_cache')
+
+    def __init__(self, id, name, code, mutually_exclusive, complete, parent, children) -> None:
         self.id = id
         self.name = name
         self.code = code
         self.mutually_exclusive = mutually_exclusive
         self.complete = complete
-        self.parent: Entity = parent
+        self.parent = parent
         self.children: list[Entity] = children
+        self._puml_cache: dict[tuple, tuple[str, list[str]]] = {}
+
+    def __repr__(self):
+        return f"Inheritance({self.id}:{self.name})"
 
     def __str__(self):
         return (
@@ -254,6 +404,7 @@ class Inheritance:
             f"Parent: {self.parent.name} \n\t"
             f"Children: {[child.name for child in self.children]} \n\t")
 
+    @_memoize_puml
     def puml(self, style_str_circle, style_str_line):
         ret_str_circle = f'circle "{self.name} {"Complete " if self.complete else ""}{"Mutually Exclusive " if self.mutually_exclusive else ""}" as {self.id} {style_str_circle}' + "\n"
         ret_str_lines = [f'{self.id} -[{style_str_line}]-|> {self.parent.id}']
@@ -263,20 +414,15 @@ class Inheritance:
 
 
 class Package(Model):
+    __slots__ = ('_puml_cache',)
+
     def __init__(self, id, name, code, entities, inheritances, relationships, associations, association_links, domains,
-                 packages=None):
+                 packages=None) -> None:
         super().__init__(id, name, code, entities, inheritances, relationships, associations, association_links,
                          domains, packages)
+        self._puml_cache: dict[tuple, str] = {}
 
-    def __str__(self):
-        return (f"Package ({self.id}): {self.name}\n\t"
-                f"Entities: {[entity.name for entity in self.entities]} \n\t"
-                f"Inheritances: \n\t\t{'\n\t\t'.join([str(inheritance) for inheritance in self.inheritances])} \n\t"
-                f"Relationships: \n\t\t{'\n\t\t'.join([str(relationship) for relationship in self.relationships])} \n\t"
-                f"Associations: {[ass.name for ass in self.associations]}\n\t"
-                f"Association links: \n\t\t{'\n\t\t'.join([str(link) for link in self.association_links])} \n\t"
-                f"Domains: \n\t\t {'\n\t\t'.join([str(domain) for domain in self.domains])}")
-
+    @_memoize_puml
     def puml(self, style_str):
         ret_str = f'package "{self.name}" as {self.id} {style_str} ' + "{\n}"
         return ret_str
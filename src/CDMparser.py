@@ -1,47 +1,197 @@
-import xml.etree.ElementTree as     ET
 import re
+import sys
+from collections import defaultdict
 import CDMmodel
 
+try:
+    from lxml import etree as ET
+except ImportError:  # lxml is optional, the standard library parser is used without it
+    import xml.etree.ElementTree as ET
+
 '''
 CDMParser class reads the input cdm file, extracts the necessary information and returns it in class object form <- CDMmodel.py
 '''
 
 
+class CDMParseError(Exception):
+    """
+    Raised when a CDM file can not be read or parsed, args[0] is the path of the file.
+    """
+    pass
+
+
+NAMESPACES = {
+    'a': 'attribute',
+    'c': 'collection',
+    'o': 'object',
+}
+
+
+def _compile(path: str):
+    """
+    Compile a fixed element path once. With lxml this is a compiled XPath evaluator, otherwise the path is expanded
+    to Clark notation and bound to ElementTree's findall, so no prefixes are resolved per call.
+
+    :param path: The element path, relative to the element the evaluator is called with.
+    :return: A callable that takes an element and returns the list of matching elements.
+    """
+    if hasattr(ET, "XPath"):
+        return ET.XPath(path, namespaces=NAMESPACES)
+    path = re.sub(r"\b([aco]):", lambda match: "{%s}" % NAMESPACES[match.group(1)], path)
+    return lambda element: element.findall(path)
+
+
+# ids and refs are interned, so the id lookups while linking mostly compare the same string objects
+_intern = sys.intern
+
+
+def _text(element, key):
+    """
+    Return the text of an optional child element, the children are only searched once.
+
+    :param element: The parent element.
+    :param key: The Clark notation key of the child element.
+    :return: The text of the child element, or None if there is no such child.
+    """
+    node = element.find(key)
+    return node.text if node is not None else None
+
+
+def _ref(element, evaluator):
+    """
+    Return the 'Ref' attribute of the first element matched by an evaluator.
+
+    :param element: The element the evaluator is called with.
+    :param evaluator: The compiled evaluator of an optional reference element.
+    :return: The referenced id, or None if there is no match.
+    """
+    nodes = evaluator(element)
+    return _intern(nodes[0].attrib['Ref']) if nodes else None
+
+
+# strips the length and precision that PowerDesigner appends to the datatype code (e.g. VA20, DC10,2)
+_DATATYPE_STRIP = re.compile(r"[0-9,]+")
+
+# subtrees of the model that are not needed to build the CDMmodel objects
+_SKIPPED_TAGS = frozenset({
+    "{%s}ConceptualDiagrams" % NAMESPACES['c'],
+})
+
+# Clark notation keys of the single step child lookups, find takes them as they are without expanding prefixes
+_A = "{%s}" % NAMESPACES['a']
+_C = "{%s}" % NAMESPACES['c']
+_O = "{%s}" % NAMESPACES['o']
+_A_NAME = _A + "Name"
+_A_CODE = _A + "Code"
+_A_OBJECT_ID = _A + "ObjectID"
+_A_DATATYPE = _A + "DataType"
+_A_LENGTH = _A + "Length"
+_A_PRECISION = _A + "Precision"
+_A_MANDATORY = _A + "BaseAttribute.Mandatory"
+_A_DEPENDENT_ROLE = _A + "DependentRole"
+_A_CARDINALITY_1TO2 = _A + "Entity1ToEntity2RoleCardinality"
+_A_CARDINALITY_2TO1 = _A + "Entity2ToEntity1RoleCardinality"
+_A_CARDINALITY = _A + "Cardinality"
+_A_MUTUALLY_EXCLUSIVE = _A + "MutuallyExclusive"
+_A_COMPLETE = _A + "Inheritance.Complete"
+
+# compiled evaluators for the multi step paths used while resolving the model elements
+_X_IDENTIFIERS = _compile("c:Identifiers/o:Identifier")
+_X_IDENTIFIER_ATTRIBUTES = _compile("c:Identifier.Attributes/*")
+_X_PRIMARY_IDENTIFIER = _compile("c:PrimaryIdentifier/o:Identifier")
+_X_ATTRIBUTES = _compile("c:Attributes/*")
+_X_DATA_ITEM_REF = _compile("c:DataItem/o:DataItem")
+_X_DOMAIN_REF = _compile("c:Domain/o:Domain")
+_X_OBJECT1_ENTITY = _compile("c:Object1/o:Entity")
+_X_OBJECT2_ENTITY = _compile("c:Object2/o:Entity")
+_X_OBJECT1_ASSOCIATION = _compile("c:Object1/o:Association")
+_X_OBJECT1_INHERITANCE = _compile("c:Object1/o:Inheritance")
+_X_PARENT_ENTITY = _compile("c:ParentEntity/o:Entity")
+_X_ENTITIES = _compile("c:Entities/o:Entity")
+_X_RELATIONSHIPS = _compile("c:Relationships/o:Relationship")
+_X_DOMAINS = _compile("c:Domains/o:Domain")
+_X_ASSOCIATIONS = _compile("c:Associations/o:Association")
+_X_ASSOCIATION_LINKS = _compile("c:AssociationsLinks/o:AssociationLink")
+_X_INHERITANCES = _compile("c:Inheritances/o:Inheritance")
+_X_INHERITANCE_LINKS = _compile("c:InheritanceLinks/o:InheritanceLink")
+_X_PACKAGES = _compile("c:Packages/o:Package")
+_X_DATA_ITEMS = _compile("c:DataItems/o:DataItem")
+_X_MAIN_MODEL = _compile("o:RootObject/c:Children/o:Model")
+
+
 class CDMParser:
     """
     The CDMParser class is used to parse the input CDM file and extract the necessary information.
     It returns the information in the form of a CDMmodel object.
     """
+    __slots__ = ('path', 'namespaces', 'tree', 'root', '_inh_link_index', '_data_items', '_attr_cache',
+                 '_descriptor_pool')
 
     def __init__(self, path: str):
         self.path = path
-        self.namespaces = {
-            'a': 'attribute',
-            'c': 'collection',
-            'o': 'object',
-        }
+        self.namespaces = NAMESPACES
+        self._inh_link_index = None
+        self._data_items = {}
+        self._attr_cache: dict[tuple[str, bool], tuple] = {}
+        self._descriptor_pool: dict[tuple, tuple] = {}
         try:
-            self.tree = ET.parse(self.path)
-            self.root = self.tree.getroot()
-        except Exception as e:
-            print("E:", e)
+            self.root = self._load(self.path)
+            self.tree = ET.ElementTree(self.root)
+        except (ET.ParseError, OSError) as e:
+            raise CDMParseError(self.path) from e
+
+    @staticmethod
+    def _load(path: str) -> ET.Element:
+        """
+                Parse the CDM file incrementally and drop the subtrees the parser never reads (the diagram symbols)
+                as soon as they are closed, so they are not held in memory for the rest of the parse.
+
+                :param path: The path to the CDM file.
+                :return: The root element of the parsed file.
+        """
+        parser = ET.iterparse(path, events=('end',))
+        for _, element in parser:
+            if element.tag in _SKIPPED_TAGS:
+                element.clear()
+        return parser.root
 
-    def link_inheritances(self, entities: list[CDMmodel.Entity], inheritances: list[CDMmodel.Inheritance]):
+    def _link_all(self, entities: list[CDMmodel.Entity], inheritances: list[CDMmodel.Inheritance],
+                  relationships: list[CDMmodel.Relationship], associations: list[CDMmodel.Association],
+                  association_links: list[CDMmodel.AssociationLink], domains: list[CDMmodel.Domain]):
+        """
+                Link all the model elements to each other, the entity index is built only once for all the links.
+
+                :param entities: The list of entities in the model.
+                :param inheritances: The list of inheritances in the model.
+                :param relationships: The list of relationships in the model.
+                :param associations: The list of associations in the model.
+                :param association_links: The list of association links in the model.
+                :param domains: The list of domains in the model.
+        """
+        by_id = {entity.id: entity for entity in entities}
+        self.link_association_links(entities, associations, association_links, by_id)
+        self.link_relationships(entities, relationships, by_id)
+        self.link_domains(entities, domains)
+        self.link_inheritances(entities, inheritances, by_id)
+
+    def link_inheritances(self, entities: list[CDMmodel.Entity], inheritances: list[CDMmodel.Inheritance],
+                          by_id: dict = None):
         """
                 Link the inheritances to their respective entities based on the 'ref' attribute.
                 Also adds an 'is_child' attribute to the child entity.
 
                 :param entities: The list of entities in the model.
                 :param inheritances: The list of inheritances in the model.
+                :param by_id: The entities indexed by their id, built from entities if not given.
         """
+        if by_id is None:
+            by_id = {entity.id: entity for entity in entities}
         for inheritance in inheritances:
-            inheritance.parent = [entity for entity in entities if entity.id == inheritance.parent][0]
-            children = []
-            for child in inheritance.children:
-                for entity in entities:
-                    if entity.id == child:
-                        entity.is_child = True
-                        children.append(entity)
+            inheritance.parent = by_id[inheritance.parent]
+            # refs to entities outside the model are skipped
+            children = [by_id[child] for child in inheritance.children if child in by_id]
+            for entity in children:
+                entity.is_child = True
             inheritance.children = children
 
     def link_domains(self, entities: list[CDMmodel.Entity], domains: list[CDMmodel.Domain]):
@@ -51,37 +201,45 @@ class CDMParser:
                 :param entities: The list of entities in the model.
                 :param domains: The list of domains in the model.
         """
+        dom_by_id = {domain.id: domain for domain in domains}
         for entity in entities:
             for attribute in entity.attributes:
                 if attribute.domain is not None:
-                    attribute.domain = [domain for domain in domains if domain.id == attribute.domain][0]
+                    attribute.domain = dom_by_id[attribute.domain]
 
-    def link_relationships(self, entities: list[CDMmodel.Entity], relationships: list[CDMmodel.Relationship]):
+    def link_relationships(self, entities: list[CDMmodel.Entity], relationships: list[CDMmodel.Relationship],
+                           by_id: dict = None):
         """
                 Link the relationships to their respective entities based on the 'ref' attribute.
 
                 :param entities: The list of entities in the model.
                 :param relationships: The list of relationships in the model.
+                :param by_id: The entities indexed by their id, built from entities if not given.
         """
+        if by_id is None:
+            by_id = {entity.id: entity for entity in entities}
         for relationship in relationships:
-            relationship.entity1 = [entity for entity in entities if entity.id == relationship.entity1][0]
-            relationship.entity2 = [entity for entity in entities if entity.id == relationship.entity2][0]
+            relationship.entity1 = by_id[relationship.entity1]
+            relationship.entity2 = by_id[relationship.entity2]
             relationship.entity1.relationships.append(relationship)
             relationship.entity2.relationships.append(relationship)
 
     def link_association_links(self, entities: list[CDMmodel.Entity], associations: list[CDMmodel.Association],
-                               association_links: list[CDMmodel.AssociationLink]):
+                               association_links: list[CDMmodel.AssociationLink], by_id: dict = None):
         """
                Link the association links to their respective associations and entities based on the 'ref' attribute.
 
                :param entities: The list of entities in the model.
                :param associations: The list of associations in the model.
                :param association_links: The list of association links in the model.
+               :param by_id: The entities indexed by their id, built from entities if not given.
        """
+        if by_id is None:
+            by_id = {entity.id: entity for entity in entities}
+        assoc_by_id = {association.id: association for association in associations}
         for association_link in association_links:
-            association_link.association = \
-                [association for association in associations if association.id == association_link.association][0]
-            association_link.entity = [entity for entity in entities if entity.id == association_link.entity][0]
+            association_link.association = assoc_by_id[association_link.association]
+            association_link.entity = by_id[association_link.entity]
             association_link.entity.association_links.append(association_link)
             association_link.association.association_links.append(association_link)
 
@@ -93,8 +251,22 @@ class CDMParser:
               :param attributes: The list of attributes in the model.
         """
         for identifier in identifiers:
-            identifier.identifier_attributes = [attribute for attribute in attributes if
-                                                attribute.id in identifier.identifier_attributes]
+            # keep the attributes in entity order, the identifier lines are rendered in that order
+            attr_ids = set(identifier.identifier_attributes)
+            identifier.identifier_attributes = [attribute for attribute in attributes if attribute.id in attr_ids]
+
+    def _type_descriptor(self, datatype: str, length: str, precision: str) -> tuple:
+        """
+                Return the shared (datatype, length, precision) tuple of a domain or data item. Equal descriptors are
+                pooled, so all the elements of the same type reference the same strings.
+
+                :param datatype: The datatype code without its length and precision.
+                :param length: The length of the datatype.
+                :param precision: The precision of the datatype.
+                :return: The pooled descriptor tuple.
+        """
+        descriptor = (datatype, length, precision)
+        return self._descriptor_pool.setdefault(descriptor, descriptor)
 
     def resolve_domain(self, domain: ET.Element) -> CDMmodel.Domain:
         """
@@ -103,14 +275,12 @@ class CDMParser:
                 :param domain: The domain element to be resolved.
                 :return: The resolved Domain object.
         """
-        id = domain.attrib['Id']
-        name = domain.find("./a:Name", self.namespaces).text
-        code = domain.find("./a:Code", self.namespaces).text
-        datatype = re.sub("[0-9]|[0-9,0-9]", '', domain.find("./a:DataType", self.namespaces).text)
-        length = domain.find("./a:Length", self.namespaces).text if domain.find("./a:Length",
-                                                                                self.namespaces) is not None else None
-        precision = domain.find("./a:Precision", self.namespaces).text if domain.find("./a:Precision",
-                                                                                      self.namespaces) is not None else None
+        id = _intern(domain.attrib['Id'])
+        name = domain.find(_A_NAME).text
+        code = domain.find(_A_CODE).text
+        datatype, length, precision = self._type_descriptor(
+            _DATATYPE_STRIP.sub('', domain.find(_A_DATATYPE).text), _text(domain, _A_LENGTH),
+            _text(domain, _A_PRECISION))
 
         return CDMmodel.Domain(id, name, code, datatype, length, precision)
 
@@ -121,27 +291,33 @@ class CDMParser:
                :param entity: The entity element whose identifiers are to be resolved.
                :return: The list of resolved Identifier objects.
         """
-        if entity.find("./c:Identifiers", self.namespaces) is None:
+        entity_identifiers = _X_IDENTIFIERS(entity)
+        if not entity_identifiers:
             return []  # return empty list
 
+        primary_identifier_ref = _intern(_X_PRIMARY_IDENTIFIER(entity)[0].attrib['Ref'])
         identifiers = []
-        for identifier in entity.find("./c:Identifiers", self.namespaces):
-            identifierID = identifier.attrib['Id']
-            name = identifier.find("./a:Name", self.namespaces).text
+        for identifier in entity_identifiers:
+            identifierID = _intern(identifier.attrib['Id'])
+            name = identifier.find(_A_NAME).text
 
-            if identifier.find("./c:Identifier.Attributes", self.namespaces) is not None:
-                identifier_attributes = [attribute.attrib['Ref'] for attribute in
-                                         identifier.find("./c:Identifier.Attributes", self.namespaces)]
-            else:
-                identifier_attributes = []
+            identifier_attributes = [_intern(attribute.attrib['Ref'])
+                                     for attribute in _X_IDENTIFIER_ATTRIBUTES(identifier)]
 
-            primary_identifier = True if identifierID == \
-                                         entity.find("./c:PrimaryIdentifier/o:Identifier",
-                                                     self.namespaces).attrib['Ref'] else False
+            primary_identifier = identifierID == primary_identifier_ref
             identifiers.append(CDMmodel.Identifier(identifierID, name, identifier_attributes, primary_identifier))
 
         return identifiers
 
+    def _prime_data_items(self, model: ET.Element):
+        """
+                Resolve all the data items of a model element in one pass and cache them by their id.
+
+                :param model: The model element whose data items are to be cached.
+        """
+        for data_item in _X_DATA_ITEMS(model):
+            self._data_items[_intern(data_item.attrib['Id'])] = self._extract_data_item(data_item)
+
     def resolve_data_item(self, model: ET.Element, data_item_id: str) -> dict:
         """
                 Resolve a data item element into a dictionary of data item data.
@@ -150,22 +326,30 @@ class CDMParser:
                 :param data_item_id: The id of the data item to be resolved.
                 :return: The dictionary of resolved data item data.
         """
-        data_item = model.find(f"./c:DataItems/o:DataItem[@Id='{data_item_id}']", self.namespaces)
+        cached = self._data_items.get(data_item_id)
+        if cached is not None:
+            return cached
+        data_item = model.find(f"{_C}DataItems/{_O}DataItem[@Id='{data_item_id}']")
+        return self._extract_data_item(data_item)
+
+    def _extract_data_item(self, data_item: ET.Element) -> dict:
+        """
+                Extract the data of a data item element into a dictionary.
+
+                :param data_item: The data item element.
+                :return: The dictionary of the data item data.
+        """
         data_item_data = dict()
 
-        data_item_data["dataItemID"] = data_item.attrib['Id']
-        data_item_data["objectID"] = data_item.find("./a:ObjectID", self.namespaces).text
-        data_item_data["name"] = data_item.find("./a:Name", self.namespaces).text
-        data_item_data["code"] = data_item.find("./a:Code", self.namespaces).text
-        data_item_data["datatype"] = re.sub("[0-9]|[0-9,0-9]", '',
-                                            data_item.find("./a:DataType", self.namespaces).text) if data_item.find(
-            "./a:DataType", self.namespaces) is not None else None
-        data_item_data["length"] = data_item.find("./a:Length", self.namespaces).text if data_item.find("./a:Length",
-                                                                                                        self.namespaces) is not None else None
-        data_item_data["precision"] = data_item.find("./a:Precision", self.namespaces).text if data_item.find(
-            "./a:Precision", self.namespaces) is not None else None
-        data_item_data["domain"] = data_item.find("./c:Domain/o:Domain", self.namespaces).attrib[
-            'Ref'] if data_item.find("./c:Domain", self.namespaces) is not None else None
+        data_item_data["dataItemID"] = _intern(data_item.attrib['Id'])
+        data_item_data["objectID"] = data_item.find(_A_OBJECT_ID).text
+        data_item_data["name"] = data_item.find(_A_NAME).text
+        data_item_data["code"] = data_item.find(_A_CODE).text
+        datatype = _text(data_item, _A_DATATYPE)
+        data_item_data["datatype"], data_item_data["length"], data_item_data["precision"] = self._type_descriptor(
+            _DATATYPE_STRIP.sub('', datatype) if datatype is not None else None, _text(data_item, _A_LENGTH),
+            _text(data_item, _A_PRECISION))
+        data_item_data["domain"] = _ref(data_item, _X_DOMAIN_REF)
         return data_item_data
 
     def resolve_attributes(self, model: ET.Element, entity: ET.Element) -> list[CDMmodel.Attribute]:
@@ -176,20 +360,22 @@ class CDMParser:
                 :param entity: The entity element whose attributes are to be resolved.
                 :return: The list of resolved Attribute objects.
         """
-        if entity.find("./c:Attributes", self.namespaces) is None:
-            return []
-
+        # the loop runs once per attribute in the file, so the lookups it repeats are bound to locals
+        attr_cache = self._attr_cache
+        Attribute = CDMmodel.Attribute
         attributes = []
-        for attribute in entity.find("./c:Attributes", self.namespaces):
-            attributeID = attribute.attrib['Id']
-            mandatory = True if attribute.find("./a:BaseAttribute.Mandatory", self.namespaces) is not None else False
-            DataItem = self.resolve_data_item(model,
-                                              attribute.find("./c:DataItem/o:DataItem", self.namespaces).attrib[
-                                                  'Ref']) if attribute.find(
-                "./c:DataItem/o:DataItem", self.namespaces) is not None else None
-            attributes.append(
-                CDMmodel.Attribute(attributeID, DataItem["name"], DataItem["code"], mandatory, DataItem["domain"],
-                                   DataItem["datatype"], DataItem["length"], DataItem["precision"]))
+        for attribute in _X_ATTRIBUTES(entity):
+            attributeID = _intern(attribute.attrib['Id'])
+            mandatory = attribute.find(_A_MANDATORY) is not None
+            data_item_ref = _ref(attribute, _X_DATA_ITEM_REF)
+            # attributes of the same data item and mandatoriness share everything but their id
+            descriptor = attr_cache.get((data_item_ref, mandatory))
+            if descriptor is None:
+                DataItem = self.resolve_data_item(model, data_item_ref) if data_item_ref is not None else None
+                descriptor = (DataItem["name"], DataItem["code"], mandatory, DataItem["domain"], DataItem["datatype"],
+                              DataItem["length"], DataItem["precision"])
+                attr_cache[(data_item_ref, mandatory)] = descriptor
+            attributes.append(Attribute(attributeID, *descriptor))
         return attributes
 
     def resolve_entity(self, model: ET.Element, entity: ET.Element) -> CDMmodel.Entity:
@@ -200,9 +386,9 @@ class CDMParser:
                 :param entity: The entity element to be resolved.
                 :return: The resolved Entity object.
         """
-        id = entity.attrib['Id']
-        name = entity.find("./a:Name", self.namespaces).text
-        code = entity.find("./a:Code", self.namespaces).text
+        id = _intern(entity.attrib['Id'])
+        name = entity.find(_A_NAME).text
+        code = entity.find(_A_CODE).text
 
         identifiers = self.resolve_entity_identifiers(entity)
         attributes = self.resolve_attributes(model, entity)
@@ -217,22 +403,23 @@ class CDMParser:
                :param relationship: The relationship element to be resolved.
                :return: The resolved Relationship object.
        """
-        id = relationship.attrib['Id']
-        name = relationship.find("./a:Name", self.namespaces).text
-        code = relationship.find("./a:Code", self.namespaces).text
+        id = _intern(relationship.attrib['Id'])
+        name = relationship.find(_A_NAME).text
+        code = relationship.find(_A_CODE).text
         dependent_e1 = False
         dependent_e2 = False
-        if relationship.find("./a:DependentRole", self.namespaces) is not None:
+        dependent_role = relationship.find(_A_DEPENDENT_ROLE)
+        if dependent_role is not None:
             # if A is dependent_e1 is True, else (is B) -> dependent_e2 is True
-            if relationship.find("./a:DependentRole", self.namespaces).text == 'A':
+            if dependent_role.text == 'A':
                 dependent_e1 = True
             else:
                 dependent_e2 = True
 
-        cardinality_1to2 = relationship.find("./a:Entity1ToEntity2RoleCardinality", self.namespaces).text
-        cardinality_2to1 = relationship.find("./a:Entity2ToEntity1RoleCardinality", self.namespaces).text
-        entity1_ref = relationship.find("./c:Object1/o:Entity", self.namespaces).attrib['Ref']
-        entity2_ref = relationship.find("./c:Object2/o:Entity", self.namespaces).attrib['Ref']
+        cardinality_1to2 = relationship.find(_A_CARDINALITY_1TO2).text
+        cardinality_2to1 = relationship.find(_A_CARDINALITY_2TO1).text
+        entity1_ref = _intern(_X_OBJECT1_ENTITY(relationship)[0].attrib['Ref'])
+        entity2_ref = _intern(_X_OBJECT2_ENTITY(relationship)[0].attrib['Ref'])
 
         return CDMmodel.Relationship(id, name, code,dependent_e1, dependent_e2, entity1_ref, entity2_ref, cardinality_1to2, cardinality_2to1)
 
@@ -244,9 +431,9 @@ class CDMParser:
                :param association: The association element to be resolved.
                :return: The resolved Association object.
         """
-        id = association.attrib['Id']
-        name = association.find("./a:Name", self.namespaces).text
-        code = association.find("./a:Code", self.namespaces).text
+        id = _intern(association.attrib['Id'])
+        name = association.find(_A_NAME).text
+        code = association.find(_A_CODE).text
 
         attributes = self.resolve_attributes(model, association)
 
@@ -259,8 +446,8 @@ class CDMParser:
                 :param model: The model element from which to get the entities.
                 :return: The list of Entity objects.
         """
-        entities = model.findall("./c:Entities/", self.namespaces)
-        if entities is None or len(entities) == 0:
+        entities = _X_ENTITIES(model)
+        if len(entities) == 0:
             return []
         return [self.resolve_entity(model, entity) for entity in entities]
 
@@ -271,7 +458,7 @@ class CDMParser:
                 :param model: The model element from which to get the relationships.
                 :return: The list of Relationship objects.
         """
-        relationships = model.findall("./c:Relationships/", self.namespaces)
+        relationships = _X_RELATIONSHIPS(model)
         return [self.resolve_relationship(relationship) for relationship in relationships]
 
     def get_domains(self, model: ET.Element) -> list[CDMmodel.Domain]:
@@ -281,7 +468,7 @@ class CDMParser:
                 :param model: The model element from which to get the domains.
                 :return: The list of Domain objects.
         """
-        domains = model.findall("./c:Domains/", self.namespaces)
+        domains = _X_DOMAINS(model)
         return [self.resolve_domain(domain) for domain in domains]
 
     def get_associations(self, model: ET.Element) -> list[CDMmodel.Association]:
@@ -291,7 +478,7 @@ class CDMParser:
                :param model: The model element from which to get the associations.
                :return: The list of Association objects.
         """
-        associations = model.findall("./c:Associations/", self.namespaces)
+        associations = _X_ASSOCIATIONS(model)
         return [self.resolve_association(model, association) for association in associations]
 
     def resolve_association_link(self, association_link: ET.Element) -> CDMmodel.AssociationLink:
@@ -302,10 +489,10 @@ class CDMParser:
                 :return: The resolved AssociationLink object.
         """
 
-        id = association_link.attrib['Id']
-        cardinality = association_link.find("./a:Cardinality", self.namespaces).text
-        association_ref = association_link.find("./c:Object1/o:Association", self.namespaces).attrib['Ref']
-        entity_ref = association_link.find("./c:Object2/o:Entity", self.namespaces).attrib['Ref']
+        id = _intern(association_link.attrib['Id'])
+        cardinality = association_link.find(_A_CARDINALITY).text
+        association_ref = _intern(_X_OBJECT1_ASSOCIATION(association_link)[0].attrib['Ref'])
+        entity_ref = _intern(_X_OBJECT2_ENTITY(association_link)[0].attrib['Ref'])
 
         return CDMmodel.AssociationLink(id, association_ref, entity_ref, cardinality)
 
@@ -316,23 +503,21 @@ class CDMParser:
                 :param model: The model element from which to get the association links.
                 :return: The list of AssociationLink objects.
         """
-        association_links = model.findall("./c:AssociationsLinks/", self.namespaces)
+        association_links = _X_ASSOCIATION_LINKS(model)
         return [self.resolve_association_link(association_link) for association_link in association_links]
 
-    def resolve_inheritance_links(self, model: ET.Element, inheritance_id: str) -> list:
+    def _build_inheritance_link_index(self, model: ET.Element) -> defaultdict:
         """
-                Resolve the inheritance links of an inheritance element into a list of children references.
+                Group the inheritance links of a model by the inheritance they belong to.
 
-                :param model: The model element that contains the inheritance.
-                :param inheritance_id: The id of the inheritance whose links are to be resolved.
-                :return: The list of children references.
+                :param model: The model element that contains the inheritance links.
+                :return: A dict mapping inheritance ids to the list of their children references.
         """
-        inheritance_links = model.findall(f"./c:InheritanceLinks/", self.namespaces)
-        children_refs = []
-        for link in inheritance_links:
-            if link.find(f"./c:Object1/o:Inheritance", self.namespaces).attrib['Ref'] == inheritance_id:
-                children_refs.append(link.find(f"./c:Object2/o:Entity", self.namespaces).attrib['Ref'])
-        return children_refs
+        index = defaultdict(list)
+        for link in _X_INHERITANCE_LINKS(model):
+            inheritance_ref = _intern(_X_OBJECT1_INHERITANCE(link)[0].attrib['Ref'])
+            index[inheritance_ref].append(_intern(_X_OBJECT2_ENTITY(link)[0].attrib['Ref']))
+        return index
 
     def resolve_inheritance(self, model: ET.Element, inheritance: ET.Element) -> CDMmodel.Inheritance:
         """
@@ -342,13 +527,13 @@ class CDMParser:
                 :param inheritance: The inheritance element to be resolved.
                 :return: The resolved Inheritance object.
         """
-        id = inheritance.attrib['Id']
-        name = inheritance.find("./a:Name", self.namespaces).text
-        code = inheritance.find("./a:Code", self.namespaces).text
-        mutually_exclusive = False if inheritance.find("./a:MutuallyExclusive", self.namespaces) is None else True
-        complete = False if inheritance.find("./a:Inheritance.Complete", self.namespaces) is None else True
-        parent_ref = inheritance.find("./c:ParentEntity/o:Entity", self.namespaces).attrib['Ref']
-        children_refs = self.resolve_inheritance_links(model, id)
+        id = _intern(inheritance.attrib['Id'])
+        name = inheritance.find(_A_NAME).text
+        code = inheritance.find(_A_CODE).text
+        mutually_exclusive = inheritance.find(_A_MUTUALLY_EXCLUSIVE) is not None
+        complete = inheritance.find(_A_COMPLETE) is not None
+        parent_ref = _intern(_X_PARENT_ENTITY(inheritance)[0].attrib['Ref'])
+        children_refs = list(self._inh_link_index.get(id, ()))
 
         return CDMmodel.Inheritance(id, name, code, mutually_exclusive, complete, parent_ref, children_refs)
 
@@ -360,8 +545,12 @@ class CDMParser:
                 :param inheritance: The inheritance element to be resolved.
                 :return: The resolved Inheritance object.
         """
-        inheritances = model.findall("./c:Inheritances/", self.namespaces)
-        return [self.resolve_inheritance(model, inheritance) for inheritance in inheritances]
+        inheritances = _X_INHERITANCES(model)
+        self._inh_link_index = self._build_inheritance_link_index(model)
+        try:
+            return [self.resolve_inheritance(model, inheritance) for inheritance in inheritances]
+        finally:
+            self._inh_link_index = None
 
     def get_packages(self, model) -> list[CDMmodel.Package]:
         """
@@ -370,13 +559,14 @@ class CDMParser:
                 :param model: The model element from which to get the packages.
                 :return: The list of Package objects.
         """
-        packages = model.findall("./c:Packages/", self.namespaces)
+        packages = _X_PACKAGES(model)
         return_packages = []
         for package in packages:
-            id = package.attrib['Id']
-            name = package.find("./a:Name", self.namespaces).text
-            code = package.find("./a:Code", self.namespaces).text
+            id = _intern(package.attrib['Id'])
+            name = package.find(_A_NAME).text
+            code = package.find(_A_CODE).text
 
+            self._prime_data_items(package)
             domains = self.get_domains(package)
             entities = self.get_entities(package)
             relationships = self.get_relationships(package)
@@ -385,10 +575,7 @@ class CDMParser:
             associations = self.get_associations(package)
             association_links = self.get_association_links(package)
 
-            self.link_association_links(entities, associations, association_links)
-            self.link_relationships(entities, relationships)
-            self.link_domains(entities, domains)
-            self.link_inheritances(entities, inheritances)
+            self._link_all(entities, inheritances, relationships, associations, association_links, domains)
             return_packages.append(
                 CDMmodel.Package(id, name, code, entities, inheritances, relationships, associations, association_links,
                                  domains))
@@ -402,11 +589,12 @@ class CDMParser:
 
                 :return: The main Model object.
         """
-        main_model = self.root.findall("./o:RootObject/c:Children/o:Model", self.namespaces)[0]
-        id = main_model.attrib['Id']
-        name = main_model.find("./a:Name", self.namespaces).text
-        code = main_model.find("./a:Code", self.namespaces).text
+        main_model = _X_MAIN_MODEL(self.root)[0]
+        id = _intern(main_model.attrib['Id'])
+        name = main_model.find(_A_NAME).text
+        code = main_model.find(_A_CODE).text
 
+        self._prime_data_items(main_model)
         domains = self.get_domains(main_model)
         entities = self.get_entities(main_model)
         relationships = self.get_relationships(main_model)
@@ -416,10 +604,7 @@ class CDMParser:
         associations = self.get_associations(main_model)
         association_links = self.get_association_links(main_model)
 
-        self.link_association_links(entities, associations, association_links)
-        self.link_relationships(entities, relationships)
-        self.link_domains(entities, domains)
-        self.link_inheritances(entities, inheritances)
+        self._link_all(entities, inheritances, relationships, associations, association_links, domains)
 
         return CDMmodel.Model(id, name, code, entities, inheritances, relationships, associations, association_links,
                               domains, packages)
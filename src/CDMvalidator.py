@@ -3,6 +3,21 @@ import PUML
 import Validation
 import ErrorLog
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# solution model of a batch worker process, set once by _init_batch_worker
+_worker_solution_model = None
+
+
+def _parse_error_message(e, message):
+    """
+    _parse_error_message function formats a CDMParseError for printing. A missing file is reported as such, other
+    errors are reported with the given message, the path of the file and the underlying error.
+    """
+    if isinstance(e.__cause__, FileNotFoundError):
+        return f"File not found: {e.args[0]}"
+    return f"{message} {e.args[0]}: {e.__cause__}"
 
 
 def normal_validation_mode(src_model_path, solution_model_path, puml_mode):
@@ -10,17 +25,34 @@ def normal_validation_mode(src_model_path, solution_model_path, puml_mode):
     normal_validation_mode function is used to parse the source and solution model, validate the source model against the solution model,
     and write the source model to a PlantUML file.
     """
+    try:
+        # Parse the solution model
+        solution_model = CDMparser.CDMParser(solution_model_path)
+        solution_model = solution_model.get_main_model()
+
+    except CDMparser.CDMParseError as e:
+        print(_parse_error_message(e, "Could not parse the solution model"))
+        return
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+        return
+
+    validate_one(src_model_path, solution_model, puml_mode)
+
+
+def validate_one(src_model_path, solution_model, puml_mode):
+    """
+    validate_one function is used to parse the source model, validate it against the already parsed solution model,
+    and write the source model to a PlantUML file. It is module level, so it can be run in a worker process.
+    """
     try:
         # Define the path of the output PlantUML file
         output_path = os.path.splitext(src_model_path)[0] + ".puml"
 
-        # Parse the source and solution models
+        # Parse the source model
         src_model = CDMparser.CDMParser(src_model_path)
         src_model = src_model.get_main_model()
 
-        solution_model = CDMparser.CDMParser(solution_model_path)
-        solution_model = solution_model.get_main_model()
-
         # Validate the source model against the solution model
         validation = Validation.Validation(src_model, solution_model)
         validation.validate()
@@ -29,6 +61,8 @@ def normal_validation_mode(src_model_path, solution_model_path, puml_mode):
         puml = PUML.PUML(puml_mode)
         puml.write_model(output_path, src_model, validation.error_log)
 
+    except CDMparser.CDMParseError as e:
+        print(_parse_error_message(e, "Skipping"))
     except FileNotFoundError as e:
         print(f"File not found: {e.filename}")
     except IOError as e:
@@ -36,17 +70,41 @@ def normal_validation_mode(src_model_path, solution_model_path, puml_mode):
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
-def batch_verification_mode(directory_path, solution_model_path, puml_mode):
+
+def _init_batch_worker(solution_model):
+    """
+    _init_batch_worker function stores the parsed solution model in a batch worker process, so it is sent to each
+    worker once instead of with every file.
+    """
+    global _worker_solution_model
+    _worker_solution_model = solution_model
+
+
+def _run_one(src_model_path, puml_mode):
+    """
+    _run_one function validates one source model in a batch worker process against the worker's solution model.
+    """
+    validate_one(src_model_path, _worker_solution_model, puml_mode)
+
+
+def batch_verification_mode(directory_path, solution_model_path, puml_mode, file_paths=None):
     """
     Function to read all the files from the specified directory and validate them.
+    If file_paths is given, the already enumerated .cdm files are validated instead of listing the directory.
     """
     # Iterate over all files in the directory
     try:
-        for filename in os.listdir(directory_path):
-            # Construct the full file path
-            if os.path.splitext(filename)[1] == ".cdm":
-                file_path = os.path.join(directory_path, filename)
-                normal_validation_mode(file_path, solution_model_path, puml_mode)
+        if file_paths is None:
+            with os.scandir(directory_path) as entries:
+                file_paths = [entry.path for entry in entries if entry.is_file() and entry.name.endswith(".cdm")]
+
+        # the solution model is parsed once and handed to each worker process when it starts
+        solution_model = CDMparser.CDMParser(solution_model_path).get_main_model()
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_batch_worker,
+                                 initargs=(solution_model,)) as executor:
+            list(executor.map(_run_one, file_paths, repeat(puml_mode)))
+    except CDMparser.CDMParseError as e:
+        print(_parse_error_message(e, "Could not parse the solution model"))
     except FileNotFoundError as e:
         print(f"File not found: {e.filename}")
     except IOError as e:
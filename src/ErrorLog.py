@@ -1,12 +1,15 @@
+import sys
 
 
 class Error:
     """
     The Error class represents an error that occurred during the execution of the program. It contains information
     about the type of object that caused the error, the id and name of the object, the type of error, and a message
-    describing the error.
+    describing the error. The message is only formatted from its template and arguments when it is read.
     """
-    def __init__(self, TypeOfObject, id, name, TypeOfError, message):
+    __slots__ = ('type', 'id', 'name', 'error', 'template', 'args')
+
+    def __init__(self, TypeOfObject, id, name, TypeOfError, message, *args):
         """
                 Initialize the Error class with the type of object that caused the error, the id and name of the object, the type of error, and a message describing the error.
 
@@ -14,13 +17,22 @@ class Error:
                 :param id: The id of the object that caused the error.
                 :param name: The name of the object that caused the error.
                 :param TypeOfError: The type of error that occurred.
-                :param message: A message describing the error.
+                :param message: A message describing the error, or its str.format template when args are given.
+                :param args: The arguments of the message template.
         """
         self.type = TypeOfObject
         self.id = id
         self.name = name
         self.error = TypeOfError
-        self.message = message
+        self.template = message
+        self.args = args
+
+    @property
+    def message(self):
+        """
+                The message describing the error.
+        """
+        return self.template.format(*self.args) if self.args else self.template
 
 
 class ErrorLog:
@@ -28,11 +40,14 @@ class ErrorLog:
         The ErrorLog class is used to log the errors that occur during the execution of the program.
         It contains a list of Error objects.
     """
+    __slots__ = ('errors', '_by_id')
+
     def __init__(self):
         """
                 Initialize the ErrorLog class and create an empty list of errors.
         """
         self.errors: list[Error] = []
+        self._by_id: dict[str, list[Error]] = {}
 
     def find_error(self, object_id):
         """
@@ -41,12 +56,10 @@ class ErrorLog:
                :param object_id: The id of the object that caused the error.
                :return: The Error object and a boolean indicating whether the error was found.
         """
-        for error in self.errors:
-            if error.id == object_id:
-                return error, True
-        return None, False
+        errors = self._by_id.get(object_id)
+        return (errors[0], True) if errors else (None, False)
 
-    def add_error(self, TypeOfObject, object_id, name, TypeOfError, message):
+    def add_error(self, TypeOfObject, object_id, name, TypeOfError, message, *args):
         """
                 Add an error to the error log.
 
@@ -54,17 +67,25 @@ class ErrorLog:
                 :param object_id: The id of the object that caused the error.
                 :param name: The name of the object that caused the error.
                 :param TypeOfError: The type of error that occurred.
-                :param message: A message describing the error.
+                :param message: A message describing the error, or its str.format template when args are given.
+                :param args: The arguments of the message template, it is formatted when the message is read.
         """
-        self.errors.append(Error(TypeOfObject, object_id, name, TypeOfError, message))
+        error = Error(TypeOfObject, object_id, name, TypeOfError, message, *args)
+        self.errors.append(error)
+        self._by_id.setdefault(object_id, []).append(error)
 
-    def prt(self):
+    def as_str(self, separator: str = "\n") -> str:
+        """
+                Join the messages of all the errors in the error log.
+
+                :param separator: The string placed between the messages.
+                :return: The messages, one per line by default.
         """
-                Print the messages of all the errors in the error log.
+        return separator.join(error.message for error in self.errors)
 
-                :return: An empty string.
+    def prt(self):
+        """
+                Print the messages of all the errors in the error log with a single write.
         """
-        str_build= ""
-        for error in self.errors:
-            print(error.message)
-        return str_build
+        if self.errors:
+            sys.stdout.write(self.as_str() + "\n")
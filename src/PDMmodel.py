@@ -5,6 +5,9 @@ The class template is used in the PDMParser class to store the information extra
 
 
 class Model:
+    __slots__ = ('id', 'name', 'code', 'tables', 'references', 'domains', 'packages', 'tables_by_id', 'refs_by_id',
+                 'domains_by_id', '_str_cache')
+
     def __init__(self, id, name, code, tables, references, domains, packages=None):
         self.id = id
         self.name = name
@@ -13,16 +16,26 @@ class Model:
         self.references: list[Reference] = references
         self.domains: list[Domain] = domains
         self.packages: list[Package] = packages if packages is not None else []
+        # id indices, the model is built once by the parser and not mutated afterwards
+        self.tables_by_id: dict[str, Table] = {table.id: table for table in self.tables}
+        self.refs_by_id: dict[str, Reference] = {reference.id: reference for reference in self.references}
+        self.domains_by_id: dict[str, Domain] = {domain.id: domain for domain in self.domains}
+        self._str_cache = None
 
     def __str__(self):
-        return (f"Model ({self.id}): {self.name}\n\t"
-                f"Entities: {[table.name for table in self.tables]} \n\t"
-                f"References: \n\t\t{'\n\t\t'.join([reference.name + ' ('+ reference.id + ')' for reference in self.references])} \n\t"
-                f"Domains: \n\t\t {'\n\t\t'.join([str(domain) for domain in self.domains])} \n\t"
-                f"Packages: \n\t\t {'\n\t\t'.join([package.name for package in self.packages])}")
+        # built on first use and cached, the model is not changed after parsing
+        if self._str_cache is None:
+            self._str_cache = (f"{type(self).__name__} ({self.id}): {self.name}\n\t"
+                               f"Entities: {[table.name for table in self.tables]} \n\t"
+                               f"References: \n\t\t{'\n\t\t'.join(f'{reference.name} ({reference.id})' for reference in self.references)} \n\t"
+                               f"Domains: \n\t\t {'\n\t\t'.join(str(domain) for domain in self.domains)} \n\t"
+                               f"Packages: \n\t\t {'\n\t\t'.join(package.name for package in self.packages)}")
+        return self._str_cache
 
 
 class Table:
+    __slots__ = ('id', 'name', 'code', 'columns', 'keys', 'indexes', 'columns_by_id', 'keys_by_id')
+
     def __init__(self, id, name, code, columns, keys=None, indexes=None):
         self.id = id
         self.name = name
@@ -31,12 +44,16 @@ class Table:
         self.columns: list[Column] = columns
         self.keys: list[Key] = keys if keys is not None else []
         self.indexes: list[Index] = indexes if indexes is not None else []
+        self.columns_by_id: dict[str, Column] = {column.id: column for column in self.columns}
+        self.keys_by_id: dict[str, Key] = {key.id: key for key in self.keys}
 
     def __str__(self):
         return f"Table({self.id}): {self.name} \n COLUMNS: {[column.name for column in self.columns]} \n KEYS: {[key.name for key in self.keys]} \n INDEXES: {[index.name for index in self.indexes]}"
 
 
 class Column:
+    __slots__ = ('id', 'name', 'code', 'mandatory', 'in_key', 'in_index', 'datatype', 'length', 'precision', 'domain')
+
     def __init__(self, id, name, code, mandatory, domain, datatype, length=None, precision=None):
         self.id = id  # attributeID not dataItemID
         self.name = name
@@ -54,6 +71,8 @@ class Column:
 
 
 class Key:
+    __slots__ = ('id', 'name', 'code', 'primary', 'columns')
+
     def __init__(self, id, name, code, primary, columns):
         self.id = id
         self.name = name
@@ -65,6 +84,8 @@ class Key:
 
 
 class Index:
+    __slots__ = ('id', 'name', 'code', 'unique', 'key', 'columns')
+
     def __init__(self, id, name, code, unique, key, columns):
         self.id = id
         self.name = name
@@ -79,6 +100,9 @@ class Index:
 
 # add update, delete constraint dictionary
 class Reference:
+    __slots__ = ('id', 'name', 'code', 'cardinality', 'update_constraint', 'delete_constraint', 'parent', 'parent_key',
+                 'child', 'joins')
+
     def __init__(self, id, name, code, cardinality, update_constraint, delete_constraint, parent, parent_key, child,
                  joins=None):
         self.id = id
@@ -96,6 +120,8 @@ class Reference:
         return f"Reference({self.id}): {self.name} || {self.parent.name} ({self.cardinality}) {self.child.name} {[str(join) for join in self.joins]} {self.update_constraint} {self.delete_constraint}"
 
     class ReferenceJoin:
+        __slots__ = ('id', 'parent_column', 'child_column')
+
         def __init__(self, id, parent, child):
             self.id = id
             self.parent_column: Column = parent
@@ -106,6 +132,8 @@ class Reference:
 
 
 class Domain:
+    __slots__ = ('id', 'name', 'code', 'datatype', 'length', 'precision')
+
     def __init__(self, id, name, code, datatype, length, precision):
         self.id = id
         self.name = name
@@ -119,12 +147,7 @@ class Domain:
 
 
 class Package(Model):
+    __slots__ = ()
+
     def __init__(self, id, name, code, tables, references, domains, packages):
         super().__init__(id, name, code, tables, references, domains, packages)
-
-    def __str__(self):
-        return (f"Package ({self.id}): {self.name}\n\t"
-                f"Entities: {[table.name for table in self.tables]} \n\t"
-                f"References: \n\t\t{'\n\t\t'.join([reference.name + ' (' + reference.id + ')' for reference in self.references])} \n\t"
-                f"Domains: \n\t\t {'\n\t\t'.join([str(domain) for domain in self.domains])} \n\t"
-                f"Packages: \n\t\t {'\n\t\t'.join([package.name for package in self.packages])}")
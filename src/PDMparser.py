@@ -1,57 +1,118 @@
-import xml.etree.ElementTree as ET
 import re
 import PDMmodel
-
+# the namespaces and the element path compiler are shared with the CDM parser
+from CDMparser import ET, NAMESPACES, _compile
+
+# Clark notation keys of the single step child lookups, the same key object is passed on every call
+_A = "{%s}" % NAMESPACES['a']
+_A_NAME = _A + "Name"
+_A_CODE = _A + "Code"
+_A_DATATYPE = _A + "DataType"
+_A_LENGTH = _A + "Length"
+_A_PRECISION = _A + "Precision"
+_A_MANDATORY = _A + "Mandatory"
+_A_UNIQUE = _A + "Unique"
+_A_CARDINALITY = _A + "Cardinality"
+_A_UPDATE_CONSTRAINT = _A + "UpdateConstraint"
+_A_DELETE_CONSTRAINT = _A + "DeleteConstraint"
+
+_X_KEY_COLUMNS = _compile("c:Key.Columns/*")
+_X_LINKED_OBJECTS = _compile("c:LinkedObject/*")
+_X_INDEX_COLUMNS = _compile("c:IndexColumns/*")
+_X_COLUMNS = _compile("c:Columns/*")
+_X_KEYS = _compile("c:Keys/*")
+_X_INDEXES = _compile("c:Indexes/*")
+_X_TABLES = _compile("c:Tables/*")
+_X_JOINS = _compile("c:Joins/*")
+_X_REFERENCES = _compile("c:References/*")
+_X_DOMAINS = _compile("c:Domains/*")
+_X_COLUMN_REF = _compile("c:Column/o:Column")
+_X_PRIMARY_KEY = _compile("c:PrimaryKey/o:Key")
+_X_OBJECT1_COLUMN = _compile("c:Object1/o:Column")
+_X_OBJECT2_COLUMN = _compile("c:Object2/o:Column")
+_X_PARENT_TABLE = _compile("c:ParentTable/o:Table")
+_X_CHILD_TABLE = _compile("c:ChildTable/o:Table")
+_X_PARENT_KEY = _compile("c:ParentKey/o:Key")
+_X_DOMAIN_REF = _compile("c:Domain/o:PhysicalDomain")
+_X_MAIN_MODEL = _compile("o:RootObject/c:Children/o:Model")
+
+# subtrees of the model that are not needed to build the PDMmodel objects
+_SKIPPED_TAGS = frozenset({
+    "{%s}PhysicalDiagrams" % NAMESPACES['c'],
+})
+
+# strips the (length) or (length,precision) suffix of a column datatype, e.g. VARCHAR(20) -> VARCHAR
+_DATATYPE_STRIP = re.compile(r'\([\d,]*\)')
 
 
 # add package support
 class PDMParser:
     def __init__(self, path: str):
         self.path = path
-        self.namespaces = {
-            'a': 'attribute',
-            'c': 'collection',
-            'o': 'object',
-        }
-        self.tree = ET.parse(self.path)
-        self.root = self.tree.getroot()
-
-    def link_references(self, references: list[PDMmodel.Reference], tables: list[PDMmodel.Table], domains: list[PDMmodel.Domain]):
+        self.namespaces = NAMESPACES
+        self.root = self._load(self.path)
+        self.tree = ET.ElementTree(self.root)
+
+    @staticmethod
+    def _load(path: str) -> ET.Element:
+        # parse incrementally and clear the diagram symbols as soon as they are read, nothing here uses them
+        parser = ET.iterparse(path, events=('end',))
+        for _, element in parser:
+            if element.tag in _SKIPPED_TAGS:
+                element.clear()
+        return parser.root
+
+    # the id indices can be given by the caller, e.g. the ones of the Model the lists belong to
+    def link_references(self, references: list[PDMmodel.Reference], tables: list[PDMmodel.Table], domains: list[PDMmodel.Domain],
+                        tables_by_id: dict[str, PDMmodel.Table] = None):
+        if tables_by_id is None:
+            tables_by_id = {table.id: table for table in tables}
         for reference in references:
-            reference.parent = [table for table in tables if reference.parent == table.id][0]
-            reference.child = [table for table in tables if reference.child == table.id][0]
-
-            for table in tables:
-                for key in table.keys:
-                    if reference.parent_key == key.id:
-                        reference.parent_key = key
+            reference.parent = tables_by_id[reference.parent]
+            reference.child = tables_by_id[reference.child]
+            # the parent key is one of the keys of the parent table
+            reference.parent_key = reference.parent.keys_by_id.get(reference.parent_key, reference.parent_key)
 
-            reference.joins = [PDMmodel.Reference.ReferenceJoin(join.id, [column for column in reference.parent.columns if join.parent_column == column.id][0], [column for column in reference.child.columns if join.child_column == column.id][0]) for join in reference.joins]
+            parent_columns = reference.parent.columns_by_id
+            child_columns = reference.child.columns_by_id
+            reference.joins = [PDMmodel.Reference.ReferenceJoin(join.id, parent_columns[join.parent_column], child_columns[join.child_column]) for join in reference.joins]
 
     def link_keys(self, tables: list[PDMmodel.Table]):
             for table in tables:
                 for key in table.keys:
-                    key.columns = [column for column in table.columns if column.id in key.columns]
+                    wanted = set(key.columns)
+                    key.columns = [column for column in table.columns if column.id in wanted]
                     for column in key.columns:
                         column.in_key = True
 
-    def link_domains(self, tables: list[PDMmodel.Table], domains: list[PDMmodel.Domain]):
-        if domains is not None or len(domains) > 0:
-            for table in tables:
-                for column in table.columns:
-                    if column.domain is not None:
-                        column.domain = [domain for domain in domains if column.domain == domain.id][0]
+    def link_domains(self, tables: list[PDMmodel.Table], domains: list[PDMmodel.Domain],
+                     domains_by_id: dict[str, PDMmodel.Domain] = None):
+        if not domains:
+            return
+        if domains_by_id is None:
+            domains_by_id = {domain.id: domain for domain in domains}
+        for table in tables:
+            for column in table.columns:
+                if column.domain is not None:
+                    column.domain = domains_by_id[column.domain]
 
     # must be called after link_keys
-    def link_indexes(self, tables: list[PDMmodel.Table], references: list[PDMmodel.Reference]):
+    def link_indexes(self, tables: list[PDMmodel.Table], references: list[PDMmodel.Reference],
+                     refs_by_id: dict[str, PDMmodel.Reference] = None):
+        if refs_by_id is None:
+            refs_by_id = {reference.id: reference for reference in references}
         for table in tables:
+            keys_by_id = table.keys_by_id
             for index in table.indexes:
-                if index.key[0] == 'r':
-                    index.key = [reference for reference in references if index.key[1:] == reference.id][0]
-                else:
-                    index.key = [key for key in table.keys if index.key[1:] == key.id][0]
-
-                index.columns = [column for column in table.columns if column.id in index.columns]
+                # indexes without a linked key or reference keep None
+                if index.key is not None:
+                    if index.key[0] == 'r':
+                        index.key = refs_by_id[index.key[1:]]
+                    else:
+                        index.key = keys_by_id[index.key[1:]]
+
+                wanted = set(index.columns)
+                index.columns = [column for column in table.columns if column.id in wanted]
                 for column in index.columns:
                     column.in_index = True
 
@@ -60,122 +121,128 @@ class PDMParser:
             return key.attrib['Ref']
 
         id = key.attrib['Id']
-        name = key.find("./a:Name", self.namespaces).text
-        code = key.find("./a:Code", self.namespaces).text
+        name = key.find(_A_NAME).text
+        code = key.find(_A_CODE).text
         primary = id == primary_key_ref
-        key_columns_ref = [resolve_key_column(key_column) for key_column in key.findall("./c:Key.Columns/", self.namespaces)]
+        key_columns_ref = [resolve_key_column(key_column) for key_column in _X_KEY_COLUMNS(key)]
 
         return PDMmodel.Key(id, name, code, primary, key_columns_ref)
 
     def resolve_index(self, index: ET.Element) -> PDMmodel.Index:
         def resolve_index_column(index: ET.Element) -> str:
-            return index.find("./c:Column/o:Column", self.namespaces).attrib['Ref']
+            return _X_COLUMN_REF(index)[0].attrib['Ref']
 
         id = index.attrib['Id']
-        name = index.find("./a:Name", self.namespaces).text
-        code = index.find("./a:Code", self.namespaces).text
-        unique = index.find("./a:Unique", self.namespaces).text if index.find("./a:Unique", self.namespaces) is not None else None
-        key_refs = index.findall("./c:LinkedObject/", self.namespaces)
+        name = index.find(_A_NAME).text
+        code = index.find(_A_CODE).text
+        unique_node = index.find(_A_UNIQUE)
+        unique = unique_node.text if unique_node is not None else None
+        key_refs = _X_LINKED_OBJECTS(index)
 
         # k for key and r for reference <- used for link resolving
-        for key_ref in key_refs:
-            if key_ref.tag == "{object}Key":
-                key_ref = "k" + key_ref.attrib['Ref']
-            else:
-                key_ref = "r" + key_ref.attrib['Ref']
+        key_ref_tags = [("k" if key_ref.tag == "{object}Key" else "r") + key_ref.attrib['Ref'] for key_ref in key_refs]
+        key_ref = key_ref_tags[0] if key_ref_tags else None
 
-        index_columns_refs = [resolve_index_column(index_column) for index_column in index.findall("./c:IndexColumns/", self.namespaces)]
+        index_columns_refs = [resolve_index_column(index_column) for index_column in _X_INDEX_COLUMNS(index)]
         return PDMmodel.Index(id, name, code, unique, key_ref, index_columns_refs)
 
     def resolve_column(self, column: ET.Element) -> PDMmodel.Column:
+        find = column.find
         id = column.attrib['Id']
-        name = column.find("./a:Name", self.namespaces).text
-        code = column.find("./a:Code", self.namespaces).text
-        mandatory = column.find("./a:Mandatory", self.namespaces).text
-        datatype = datatype = re.sub("[(0-9)]|[(0-9,0-9)]", '', column.find("./a:DataType", self.namespaces).text)
-        length = column.find("./a:Length", self.namespaces).text if column.find("./a:Length",
-                                                                              self.namespaces) is not None else None
-        precision = column.find("./a:Precision", self.namespaces).text if column.find("./a:Precision",
-                                                                                  self.namespaces) is not None else None
-        domain_ref = column.find("./c:Domain/o:PhysicalDomain", self.namespaces).attrib['Ref'] if column.find(
-            "./c:Domain/o:PhysicalDomain", self.namespaces) is not None else None
+        name = find(_A_NAME).text
+        code = find(_A_CODE).text
+        mandatory = find(_A_MANDATORY).text
+        datatype = _DATATYPE_STRIP.sub('', find(_A_DATATYPE).text)
+        length_node = find(_A_LENGTH)
+        length = length_node.text if length_node is not None else None
+        precision_node = find(_A_PRECISION)
+        precision = precision_node.text if precision_node is not None else None
+        domain_nodes = _X_DOMAIN_REF(column)
+        domain_ref = domain_nodes[0].attrib['Ref'] if domain_nodes else None
         return PDMmodel.Column(id, name, code, mandatory,domain_ref, datatype, length, precision)
 
     def resolve_table(self, table: ET.Element) -> PDMmodel.Table:
+        find = table.find
         id = table.attrib['Id']
-        name = table.find("./a:Name", self.namespaces).text
-        code = table.find("./a:Code", self.namespaces).text
+        name = find(_A_NAME).text
+        code = find(_A_CODE).text
 
-        columns = [self.resolve_column(column) for column in table.findall("./c:Columns/", self.namespaces)]
-        primary_key_ref = table.find("./c:PrimaryKey/o:Key", self.namespaces).attrib['Ref']
-        keys = [self.resolve_key(key, primary_key_ref) for key in table.findall("./c:Keys/", self.namespaces)]
-        indexes = [self.resolve_index(index) for index in table.findall("./c:Indexes/", self.namespaces)]
+        resolve_column = self.resolve_column
+        resolve_key = self.resolve_key
+        resolve_index = self.resolve_index
+        columns = [resolve_column(column) for column in _X_COLUMNS(table)]
+        primary_key_ref = _X_PRIMARY_KEY(table)[0].attrib['Ref']
+        keys = [resolve_key(key, primary_key_ref) for key in _X_KEYS(table)]
+        indexes = [resolve_index(index) for index in _X_INDEXES(table)]
 
         return PDMmodel.Table(id, name, code, columns, keys, indexes)
 
     def get_tables(self, model: ET.Element) -> list[PDMmodel.Table]:
-        tables = model.findall("./c:Tables/", self.namespaces)
+        tables = _X_TABLES(model)
         return [self.resolve_table(table) for table in tables]
 
     def resolve_joins(self, joins: list[ET.Element]) -> list[PDMmodel.Reference.ReferenceJoin]:
         return_joins = []
         for join in joins:
             id = join.attrib['Id']
-            parent_column_ref = join.find("./c:Object1/o:Column", self.namespaces).attrib['Ref']
-            child_column_ref = join.find("./c:Object2/o:Column", self.namespaces).attrib['Ref']
+            parent_column_ref = _X_OBJECT1_COLUMN(join)[0].attrib['Ref']
+            child_column_ref = _X_OBJECT2_COLUMN(join)[0].attrib['Ref']
             return_joins.append(PDMmodel.Reference.ReferenceJoin(id, parent_column_ref, child_column_ref))
         return return_joins
 
     def resolve_reference(self, reference: ET.Element) -> PDMmodel.Reference:
+        find = reference.find
         id = reference.attrib['Id']
-        name = reference.find("./a:Name", self.namespaces).text
-        code = reference.find("./a:Code", self.namespaces).text
-        cardinality = reference.find("./a:Cardinality", self.namespaces).text
-        update_constraint = reference.find("./a:UpdateConstraint", self.namespaces).text
-        delete_constraint = reference.find("./a:DeleteConstraint", self.namespaces).text
-        parent_ref = reference.find("./c:ParentTable/o:Table", self.namespaces).attrib['Ref']
-        child_ref = reference.find("./c:ChildTable/o:Table", self.namespaces).attrib['Ref']
-        parent_key_ref = reference.find("./c:ParentKey/o:Key", self.namespaces).attrib['Ref']
-        joins = self.resolve_joins(reference.findall("./c:Joins/", self.namespaces))
+        name = find(_A_NAME).text
+        code = find(_A_CODE).text
+        cardinality = find(_A_CARDINALITY).text
+        update_constraint = find(_A_UPDATE_CONSTRAINT).text
+        delete_constraint = find(_A_DELETE_CONSTRAINT).text
+        parent_ref = _X_PARENT_TABLE(reference)[0].attrib['Ref']
+        child_ref = _X_CHILD_TABLE(reference)[0].attrib['Ref']
+        parent_key_ref = _X_PARENT_KEY(reference)[0].attrib['Ref']
+        joins = self.resolve_joins(_X_JOINS(reference))
         return PDMmodel.Reference(id, name, code, cardinality, update_constraint, delete_constraint, parent_ref,
                                   parent_key_ref, child_ref, joins)
 
     def get_references(self, model: ET.Element) -> list[PDMmodel.Reference]:
-        references = model.findall("./c:References/", self.namespaces)
+        references = _X_REFERENCES(model)
         return [self.resolve_reference(reference) for reference in references]
 
     def resolve_domain(self, domain: ET.Element) -> PDMmodel.Domain:
         id = domain.attrib['Id']
-        name = domain.find("./a:Name", self.namespaces).text
-        code = domain.find("./a:Code", self.namespaces).text
-        datatype = domain.find("./a:DataType", self.namespaces).text
-        length = domain.find("./a:Length", self.namespaces).text if domain.find("./a:Length",
-                                                                                self.namespaces) is not None else None
-        precision = domain.find("./a:Precision", self.namespaces).text if domain.find("./a:Precision",
-                                                                                      self.namespaces) is not None else None
+        name = domain.find(_A_NAME).text
+        code = domain.find(_A_CODE).text
+        datatype = domain.find(_A_DATATYPE).text
+        length_node = domain.find(_A_LENGTH)
+        length = length_node.text if length_node is not None else None
+        precision_node = domain.find(_A_PRECISION)
+        precision = precision_node.text if precision_node is not None else None
         return PDMmodel.Domain(id, name, code, datatype, length, precision)
 
     def get_domains(self, model: ET.Element) -> list[PDMmodel.Domain]:
-        domains = model.findall("./c:Domains/", self.namespaces)
+        domains = _X_DOMAINS(model)
         return [self.resolve_domain(domain) for domain in domains]
 
     def get_main_model(self) -> PDMmodel.Model:
-        main_model = self.root.findall("./o:RootObject/c:Children/o:Model", self.namespaces)[0]
+        main_model = _X_MAIN_MODEL(self.root)[0]
         id = main_model.attrib['Id']
-        name = main_model.find("./a:Name", self.namespaces).text
-        code = main_model.find("./a:Code", self.namespaces).text
+        name = main_model.find(_A_NAME).text
+        code = main_model.find(_A_CODE).text
 
         domains = self.get_domains(main_model)
         tables = self.get_tables(main_model)
         references = self.get_references(main_model)
         #packages = self.get_packages(main_model)
 
-        self.link_references(references, tables, domains)
-        self.link_domains(tables, domains)
+        # the model is built first, so that the link passes use its id indices
+        model = PDMmodel.Model(id, name, code, tables, references, domains)
+        self.link_references(references, tables, domains, model.tables_by_id)
+        self.link_domains(tables, domains, model.domains_by_id)
         self.link_keys(tables)
-        self.link_indexes(tables, references)
+        self.link_indexes(tables, references, model.refs_by_id)
 
-        return PDMmodel.Model(id, name, code, tables, references, domains)
+        return model
 
 
 if __name__ == '__main__':
@@ -2,7 +2,34 @@ from plantuml import PlantUML
 import CDMmodel
 import ErrorLog
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from os.path import abspath
+from types import MappingProxyType
+
+# the characters PlantUML can not take in cp1252, mapped to their closest replacement
+_CORRECT_TABLE = str.maketrans({u"\u010c": 'C', u"\u010d": 'c'})
+
+# styles for different elements and statuses to be used in the model, read-only and interned once
+_STYLE = MappingProxyType({name: sys.intern(style) for name, style in {
+    "entity_ok": "#ffffff/b0ffff;line:00aaaa",
+    "entity_error": "#FF0000;line:000000",
+
+    "association_ok": "#ffffff/d0d0ff;line:8080ff",
+    "association_error": "#FF0000;line:000000",
+
+    "inheritance_ok": "#ffffff/b0ffff;line:8080ff",
+    "inheritance_error": "#FF0000;line:000000",
+
+    "inheritance_link_ok": "#8080ff",
+    "inheritance_link_error": "#FF0000",
+
+    "relationship_ok": "#8080ff",
+    "relationship_error": "#FF0000",
+
+    "package_ok": "#ffffff/ffffc0;line:b2b2b2"
+}.items()})
 
 """
         The PUML class is used to write a model to a file in PlantUML format and then process it to an image.
@@ -26,124 +53,95 @@ class PUML:
             self.server = PlantUML(url='http://www.plantuml.com/plantuml/svg/', basic_auth={}, form_auth={},
                                    http_opts={}, request_opts={})
 
-        # styles for different elements and statuses to be used in the model
-        self.style = {
-            "entity_ok": "#ffffff/b0ffff;line:00aaaa",
-            "entity_error": "#FF0000;line:000000",
+        # styles for different elements and statuses to be used in the model, shared by all instances
+        self.style = _STYLE
+
+    def write_model(self, path: str, model: CDMmodel.Model, error_log: ErrorLog):
+        """
+                Write a model to a file in PlantUML format, corrected for the cp1252 encoding, and process it to an image.
+
+                :param path: The path to the output PlantUML file.
+                :param model: The model to be written to the file.
+                :param error_log: The error log for the model.
+        """
+        self.write_file(path, model, error_log)
+        self.process_file(f"{path}")
 
-            "association_ok": "#ffffff/d0d0ff;line:8080ff",
-            "association_error": "#FF0000;line:000000",
+    def render_many(self, jobs: list[tuple[str, CDMmodel.Model, ErrorLog]], max_workers: int = 8):
+        """
+                Write several models to PlantUML files and process them to images. The files are written one after
+                another, the requests to the PlantUML server, which are network bound, run in a thread pool.
 
-            "inheritance_ok": "#ffffff/b0ffff;line:8080ff",
-            "inheritance_error": "#FF0000;line:000000",
+                :param jobs: The (path, model, error log) triples of the models to be written.
+                :param max_workers: The maximum number of concurrent requests to the PlantUML server.
+        """
+        paths = []
+        for path, model, error_log in jobs:
+            self.write_file(path, model, error_log)
+            paths.append(path)
 
-            "inheritance_link_ok": "#8080ff",
-            "inheritance_link_error": "#FF0000",
+        # the PlantUML client's http connection is not thread safe, so every thread gets its own client
+        local = threading.local()
 
-            "relationship_ok": "#8080ff",
-            "relationship_error": "#FF0000",
+        def process(path):
+            if not hasattr(local, "puml"):
+                local.puml = PUML(self.mode)
+            local.puml.process_file(path)
 
-            "package_ok": "#ffffff/ffffc0;line:b2b2b2"
-        }
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(process, paths))
 
-    def write_model(self, path: str, model: CDMmodel.Model, error_log: ErrorLog):
+    def write_file(self, path: str, model: CDMmodel.Model, error_log: ErrorLog):
         """
-                Write a model to a file in PlantUML format, correct the file, and process it to an image.
+                Write a model to a file in PlantUML format, corrected for the cp1252 encoding.
 
                 :param path: The path to the output PlantUML file.
                 :param model: The model to be written to the file.
                 :param error_log: The error log for the model.
         """
-        e_msg = ""
-        for error in error_log.errors:
-            e_msg += f"{error.message} \n"
-
         model_str = f"@startuml  \n hide cirlcle \n title {model.name} \n"
-        if e_msg == "":
+        if not error_log.errors:
             message = f'legend top left \n no errors \n end legend'
         else:
-            message = f'legend top left \n {e_msg} \n end legend'
-
-        tables = []
-        for table in model.entities:
-            if error_log.find_error(table.id)[1]:
-                tables.append(table.puml(self.style["entity_error"]))
-            else:
-                tables.append(table.puml(self.style["entity_ok"]))
-
-        # association and association links
-        associations = []
-        for association in model.associations:
-            if error_log.find_error(association.id)[1]:
-                associations.append(association.puml(self.style["association_error"]))
-            else:
-                associations.append(association.puml(self.style["association_ok"]))
-
-        associations_links = []
-        for association_link in model.association_links:
-            if error_log.find_error(association_link.id)[1]:
-                associations_links.append(association_link.puml(self.style["relationship_error"]))
-            else:
-                associations_links.append(association_link.puml(self.style["relationship_ok"]))
-
+            # every message line of the legend, the last one included, ends with " \n"
+            e_msg = error_log.as_str(" \n")
+            message = f'legend top left \n {e_msg} \n \n end legend'
+
+        # ids of the objects with at least one logged error, the log does not change while the model is written
+        error_ids = {error.id for error in error_log.errors}
+
+        # the element kinds that render with a single style: (elements, ok style, error style)
+        kinds = {
+            "entity": (model.entities, "entity_ok", "entity_error"),
+            "association": (model.associations, "association_ok", "association_error"),
+            "association_link": (model.association_links, "relationship_ok", "relationship_error"),
+            "package": (model.packages, "package_ok", "entity_error"),
+            "relationship": (model.relationships, "relationship_ok", "relationship_error"),
+        }
+        rendered = {}
+        for kind, (elements, ok_style, error_style) in kinds.items():
+            ok, error = self.style[ok_style], self.style[error_style]
+            rendered[kind] = [element.puml(error if element.id in error_ids else ok) for element in elements]
+
+        # inheritances render a node and its links, with a separate style for each
+        inheritance_ok = (self.style["inheritance_ok"], self.style["inheritance_link_ok"])
+        inheritance_error = (self.style["inheritance_error"], self.style["inheritance_link_error"])
         inheritances_nodes = []
         inheritances_links = []
         for inheritance in model.inheritances:
-            if error_log.find_error(inheritance.id)[1]:
-                node, links = inheritance.puml(self.style["inheritance_error"], self.style["inheritance_link_error"])
-            else:
-                node, links = inheritance.puml(self.style["inheritance_ok"], self.style["inheritance_link_ok"])
+            node, links = inheritance.puml(*(inheritance_error if inheritance.id in error_ids else inheritance_ok))
             inheritances_nodes.append(node)
             inheritances_links.extend(links)
 
-        packages = []
-        for package in model.packages:
-            if error_log.find_error(package.id)[1]:
-                packages.append(package.puml(self.style["entity_error"]))
-            else:
-                packages.append(package.puml(self.style["package_ok"]))
-
-        relationships = []
-        for relationship in model.relationships:
-            if error_log.find_error(relationship.id)[1]:
-                relationships.append(relationship.puml(self.style["relationship_error"]))
-            else:
-                relationships.append(relationship.puml(self.style["relationship_ok"]))
-
         end = "@enduml"
 
-        # write the model to a file
-        with open(f"{path}", "w", encoding="utf-8") as file:
-            file.write(model_str)
-            file.write("\n")
-            file.write(message)
-            file.write("\n")
-            for table in tables:
-                file.write(table)
-                file.write("\n")
-            for association in associations:
-                file.write(association)
-                file.write("\n")
-            for package in packages:
-                file.write(package)
-                file.write("\n")
-            for node in inheritances_nodes:
-                file.write(node)
-                file.write("\n")
-            for relationship in relationships:
-                file.write(relationship)
-                file.write("\n")
-            for association_link in associations_links:
-                file.write(association_link)
-                file.write("\n")
-            for link in inheritances_links:
-                file.write(link)
-                file.write("\n")
-            file.write(end)
-
-        # correct the file and process it to an image
-        self.correct_file(f"{path}")
-        self.process_file(f"{path}")
+        # write the model to a file, the document is assembled first, corrected and written at once in the
+        # cp1252 encoding used by the PlantUML library
+        parts = [model_str, message, *rendered["entity"], *rendered["association"], *rendered["package"],
+                 *inheritances_nodes, *rendered["relationship"], *rendered["association_link"], *inheritances_links,
+                 end]
+        with open(f"{path}", "w", encoding="cp1252", errors="replace") as file:
+            file.write("\n".join(parts).translate(_CORRECT_TABLE))
 
     def correct_file(self, path: str):
         """
@@ -151,11 +149,10 @@ class PUML:
                 :param path: The path to the file to be corrected.
         """
         with open(rf'{path}', 'r', encoding='utf-8') as file:
-            data = file.read()
-            data = data.replace(u"\u010c", 'C')
-            data = data.replace(u"\u010d", 'c')
+            data = file.read().translate(_CORRECT_TABLE)
 
-        with open(rf'{path}', 'w', encoding='cp1252') as file:
+        # any other character outside cp1252 is written as '?' instead of failing the whole diagram
+        with open(rf'{path}', 'w', encoding='cp1252', errors='replace') as file:
             file.write(data)
 
     def process_file(self, path: str):
@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import Set
 
 import CDMmodel
@@ -5,6 +6,89 @@ import CDMparser
 import WordMatch
 import ErrorLog
 
+# scipy solves the assignment problem in C when it is installed, otherwise the hungarian method below is used
+try:
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+except ImportError:
+    linear_sum_assignment = None
+
+
+def _hungarian(cost):
+    """
+    Solve the assignment problem with the hungarian method.
+
+    :param cost: The cost matrix with at most as many rows as columns.
+    :return: The column assigned to each row, such that the sum of the costs is minimal.
+    """
+    rows, columns = len(cost), len(cost[0])
+    u = [0.0] * (rows + 1)
+    v = [0.0] * (columns + 1)
+    # row assigned to each column, rows and columns are counted from 1 and 0 means unassigned
+    assigned = [0] * (columns + 1)
+    way = [0] * (columns + 1)
+
+    for row in range(1, rows + 1):
+        assigned[0] = row
+        column = 0
+        min_v = [float("inf")] * (columns + 1)
+        used = [False] * (columns + 1)
+        while assigned[column]:
+            used[column] = True
+            current_row = assigned[column]
+            row_cost = cost[current_row - 1]
+            delta, next_column = float("inf"), 0
+            for j in range(1, columns + 1):
+                if not used[j]:
+                    reduced = row_cost[j - 1] - u[current_row] - v[j]
+                    if reduced < min_v[j]:
+                        min_v[j], way[j] = reduced, column
+                    if min_v[j] < delta:
+                        delta, next_column = min_v[j], j
+            for j in range(columns + 1):
+                if used[j]:
+                    u[assigned[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_v[j] -= delta
+            column = next_column
+
+        # flip the augmenting path
+        while column:
+            previous_column = way[column]
+            assigned[column] = assigned[previous_column]
+            column = previous_column
+
+    result = [-1] * rows
+    for column in range(1, columns + 1):
+        if assigned[column]:
+            result[assigned[column] - 1] = column - 1
+    return result
+
+
+def _max_weight_assignment(weights):
+    """
+    Assign the columns of a weight matrix to its rows, such that the sum of the weights is maximal.
+
+    :param weights: The weight matrix.
+    :return: The column assigned to each row, -1 for the rows left without a column.
+    """
+    if linear_sum_assignment is not None:
+        result = [-1] * len(weights)
+        for row, column in zip(*linear_sum_assignment(np.array(weights), maximize=True)):
+            result[row] = int(column)
+        return result
+
+    cost = [[-weight for weight in row] for row in weights]
+    if len(cost) <= len(cost[0]):
+        return _hungarian(cost)
+
+    # more rows than columns, assign the rows to the columns instead
+    result = [-1] * len(cost)
+    for column, row in enumerate(_hungarian([list(column) for column in zip(*cost)])):
+        result[row] = column
+    return result
+
 
 class Validation:
     """
@@ -16,7 +100,7 @@ class Validation:
     def __init__(self, src_model: CDMmodel.Model, solution_model: CDMmodel.Model):
         """
         Initialize the Validation class with a source model and a solution model.
-        Also initializes a WordMatch instance and an ErrorLog instance.
+        Also gets the shared WordMatch instance and initializes an ErrorLog instance.
 
         :param src_model: The source model to be validated.
         :param solution_model: The solution model to validate against.
@@ -24,9 +108,40 @@ class Validation:
         self.solution_model: CDMmodel.Model = solution_model
         self.src_model: CDMmodel.Model = src_model
         self.name_match_threshold = 0.85
-        self.wm = WordMatch.WordMatch()
+        self.wm = WordMatch.shared(self.name_match_threshold)
         self.error_log = ErrorLog.ErrorLog()
 
+        # upper case names of all named model objects, keyed by the object id
+        self._upper_names = {}
+        for model in (src_model, solution_model):
+            for obj in self._named_objects(model):
+                self._upper_names[id(obj)] = obj.name.upper()
+
+    @staticmethod
+    def _named_objects(model):
+        """
+                Iterate over the named objects of a model whose names are compared during the validation.
+
+                :param model: The model to iterate over.
+        """
+        for entity in model.entities:
+            yield entity
+            yield from entity.attributes
+        for association in model.associations:
+            yield association
+            yield from association.attributes
+        yield from model.relationships
+
+    def _upper(self, obj):
+        """
+                Get the upper case name of a model object.
+
+                :param obj: The model object.
+                :return: The upper case name of the object.
+        """
+        name = self._upper_names.get(id(obj))
+        return obj.name.upper() if name is None else name
+
     def validate(self):
         """
         Validate the entities, relationships, and inheritances in the source model against the solution model.
@@ -44,44 +159,54 @@ class Validation:
         src_entities = self.src_model.entities
         solution_entities = self.solution_model.entities
 
-        # Create a set of solution entities to track unmatched entities
-        unmatched_solution_entities = set(solution_entities)
-
-        for src_entity in src_entities:
-            # Get the most similar entity name from the solution model
-            solution_entity_match, score = self.wm.compare_word(
-                src_entity.name,
-                [entity.name for entity in unmatched_solution_entities]
-            )
+        # Score all entity names at once and track the matched solution entities by index
+        scores = self.wm.score_matrix([self._upper(entity) for entity in src_entities],
+                                      [self._upper(entity) for entity in solution_entities], normalized=True)
+        matched = [False] * len(solution_entities)
 
-            # If the score is above the threshold, try to match the entities
+        # Pair the entities with the solution entities they match best
+        for src_entity, (index, score) in zip(src_entities, self._assign(scores)):
+            # If the score is above the threshold, match the entities
             if score > self.name_match_threshold:
-                matching_entity = next(
-                    (entity for entity in unmatched_solution_entities if entity.name == solution_entity_match),
-                    None
-                )
-                if matching_entity:
-                    unmatched_solution_entities.remove(matching_entity)
-                    self.validate_entity(src_entity.id, matching_entity.id)
-                else:
-                    self.error_log.add_error(
-                        "Entity", src_entity.id, src_entity.name, "Error",
-                        f"Matching entity {solution_entity_match} not found in solution model or already matched"
-                    )
+                matched[index] = True
+                self.validate_entity(src_entity.id, solution_entities[index].id)
             else:
                 self.error_log.add_error(
                     "Entity", src_entity.id, src_entity.name, "Error",
-                    f"Entity {src_entity.name} not found in solution model"
+                    "Entity {} not found in solution model", src_entity.name
                 )
 
         # if there are unmatched entities in the solution model, log them as errors
-        if unmatched_solution_entities:
-            for entity in unmatched_solution_entities:
+        for entity, is_matched in zip(solution_entities, matched):
+            if not is_matched:
                 self.error_log.add_error(
                     "Entity", None, None, "Error",
-                    f"Unmatched entity in solution model: {entity.name}"
+                    "Unmatched entity in solution model: {}", entity.name
                 )
 
+    def _assign(self, scores):
+        """
+                Pair the source items with the solution items using their score matrix.
+                The pairing first maximizes the number of pairs above the threshold and then the sum of their scores.
+
+                :param scores: The score matrix, row i holds the scores of source item i.
+                :return: The index of the paired solution item (-1 if there is none) and the score, for each source item.
+        """
+        if not scores or not scores[0]:
+            return [(-1, 0.0)] * len(scores)
+
+        # every pair above the threshold outweighs any difference in the scores of the other pairs
+        bonus = min(len(scores), len(scores[0])) + 1
+        weights = [[bonus + score if score > self.name_match_threshold else 0.0 for score in row] for row in scores]
+
+        pairs = []
+        for row, column in enumerate(_max_weight_assignment(weights)):
+            if column >= 0 and weights[row][column]:
+                pairs.append((column, scores[row][column]))
+            else:
+                pairs.append((-1, 0.0))
+        return pairs
+
     def validate_entity(self, src_entity_id, solution_entity_id):
         """
                 Validate an entity in the source model against an entity in the solution model.
@@ -89,8 +214,8 @@ class Validation:
                 :param src_entity_id: The id of the entity in the source model.
                 :param solution_entity_id: The id of the entity in the solution model.
         """
-        src_entity = [entity for entity in self.src_model.entities if entity.id == src_entity_id][0]
-        solution_entity = [entity for entity in self.solution_model.entities if entity.id == solution_entity_id][0]
+        src_entity = self.src_model.get_entity_by_id(src_entity_id)
+        solution_entity = self.solution_model.get_entity_by_id(solution_entity_id)
 
         # check for inheritence
         if src_entity.is_child != solution_entity.is_child:
@@ -108,81 +233,79 @@ class Validation:
                 :param src_table_id: The id of the entity in the source model.
                 :param solution_table_id: The id of the entity in the solution model.
         """
-        # Create a set of solution attributes to track unmatched entities
-        unmatched_solution_attributes: set[CDMmodel.Identifier] = set(
-            self.solution_model.get_attributes(solution_table_id))
+        src_attributes = self.src_model.get_attributes(src_table_id)
+        solution_attributes = self.solution_model.get_attributes(solution_table_id)
 
-        for src_attribute in self.src_model.get_attributes(src_table_id):
-            # get the most similar attribute name from the solution model
-            solution_attribute_match_name, score = self.wm.compare_word(src_attribute.name,
-                                                                        [attribute.name for attribute in
-                                                                         unmatched_solution_attributes])
+        # Score all attribute names at once and track the matched solution attributes by index
+        scores = self.wm.score_matrix([self._upper(attribute) for attribute in src_attributes],
+                                      [self._upper(attribute) for attribute in solution_attributes],
+                                      normalized=True)
+        matched = [False] * len(solution_attributes)
 
+        # pair the attributes with the solution attributes they match best
+        for src_attribute, (index, score) in zip(src_attributes, self._assign(scores)):
             # if the score is above the threshold, validate the attributes
             if score > self.name_match_threshold:
-                matching_attribute = next(
-                    (attribute for attribute in unmatched_solution_attributes if
-                     attribute.name == solution_attribute_match_name),
-                    None
-                )
-
-                if matching_attribute:
-                    unmatched_solution_attributes.remove(matching_attribute)
-                    if src_attribute.datatype != matching_attribute.datatype:
-                        self.error_log.add_error("Attribute", src_table_id, src_attribute.name, "Error",
-                                                 f"Attribute {src_attribute.name} datatype mismatch")
-
-                    if src_attribute.mandatory != matching_attribute.mandatory:
-                        self.error_log.add_error("Attribute", src_table_id, src_attribute.name, "Error",
-                                                 f"Attribute {src_attribute.name} mandatory property mismatch")
-                else:
-                    self.error_log.add_error(
-                        "Attribute", src_table_id, None, "Error",
-                        f"Matching attribute {solution_attribute_match_name} not found in solution model or already matched"
-                    )
+                matched[index] = True
+                matching_attribute = solution_attributes[index]
+                if src_attribute.datatype != matching_attribute.datatype:
+                    self.error_log.add_error("Attribute", src_table_id, src_attribute.name, "Error",
+                                             "Attribute {} datatype mismatch", src_attribute.name)
+
+                if src_attribute.mandatory != matching_attribute.mandatory:
+                    self.error_log.add_error("Attribute", src_table_id, src_attribute.name, "Error",
+                                             "Attribute {} mandatory property mismatch", src_attribute.name)
             else:
                 self.error_log.add_error("Attribute", src_table_id, src_attribute.name, "Error",
-                                         f"Attribute {src_attribute.name} not found in the solution model")
+                                         "Attribute {} not found in the solution model", src_attribute.name)
 
-        # if there are unmatched entities in the solution model, log them as errors
-        if unmatched_solution_attributes:
-            for attribute in unmatched_solution_attributes:
+        # if there are unmatched attributes in the solution model, log them as errors
+        for attribute, is_matched in zip(solution_attributes, matched):
+            if not is_matched:
                 self.error_log.add_error(
                     "Entity", src_table_id, None, "Error",
-                    f"Unmatched attribute in entity {self.src_model.get_table_name_by_id(src_table_id)}: {attribute.name}"
+                    "Unmatched attribute in entity {}: {}", self.src_model.get_table_name_by_id(src_table_id), attribute.name
                 )
 
-    def validate_identifier_attributes(self, src_identifier, solution_identifiers):
+    def validate_identifier_attributes(self, src_identifier, solution_identifiers, solution_identifier_attributes=None):
         """
                 Validate the attributes of an identifier in the source model against the attributes of an identifier in the solution model.
 
                 :param src_identifier: The identifier in the source model.
                 :param solution_identifiers: The identifiers in the solution model.
+                :param solution_identifier_attributes: The upper case attribute names of each solution identifier,
+                                                       collected here when not given.
         """
-        solution_identifier_attributes = [
-            [attribute.name for attribute in identifier.identifier_attributes]
-            for identifier in solution_identifiers
+        solution_identifiers = list(solution_identifiers)
+        if solution_identifier_attributes is None:
+            solution_identifier_attributes = [
+                [self._upper(attribute) for attribute in identifier.identifier_attributes]
+                for identifier in solution_identifiers
+            ]
+
+        # best score of every source attribute against the attributes of each solution identifier
+        src_attribute_names = [self._upper(attribute) for attribute in src_identifier.identifier_attributes]
+        best_scores = [
+            [max(row, default=0.0)
+             for row in self.wm.score_matrix(src_attribute_names, sol_attributes, normalized=True)]
+            for sol_attributes in solution_identifier_attributes
         ]
 
-        for src_attribute in src_identifier.identifier_attributes:
-            scores = []
-            for sol_attributes in solution_identifier_attributes:
-                solution_attribute_match_name, score = self.wm.compare_word(src_attribute.name, sol_attributes)
-                scores.append(score)
+        for i, src_attribute in enumerate(src_identifier.identifier_attributes):
+            scores = [identifier_scores[i] for identifier_scores in best_scores]
             # Check if the minimum score is below the threshold
             if min(scores) < self.name_match_threshold:
                 self.error_log.add_error("Identifier", src_identifier.id, src_attribute.name, "Error",
-                                         f"Identifier attributes mismatch in solution model")
+                                         "Identifier attributes mismatch in solution model")
 
                 return None, False
 
-        # If we pass all checks, return the matching identifier object and True
-        for identifier in solution_identifiers:
-            sol_attributes = [attribute.name for attribute in identifier.identifier_attributes]
-            match_found = all(self.wm.compare_word(src_attribute.name, sol_attributes)[1] >= self.name_match_threshold
-                              for src_attribute in src_identifier.identifier_attributes)
-            if match_found:
-                return identifier, True
+        # If we pass all checks, return the identifier with the best worst attribute score and True
+        worst_scores = [min(identifier_scores, default=1.0) for identifier_scores in best_scores]
+        if worst_scores:
+            best = max(range(len(worst_scores)), key=worst_scores.__getitem__)
+            if worst_scores[best] >= self.name_match_threshold:
+                return solution_identifiers[best], True
 
         # If no matches found
         return None, False
@@ -196,71 +319,107 @@ class Validation:
                 :param solution_table_id: The id of the entity in the solution model.
         """
         src_identifiers = self.src_model.get_identifiers(src_table_id)
-        unmatched_solution_identifiers: set[CDMmodel.Identifier] = set(
-            self.solution_model.get_identifiers(solution_table_id))
+        solution_identifiers: list[CDMmodel.Identifier] = self.solution_model.get_identifiers(solution_table_id)
+
+        # collect the attribute names of the solution identifiers once and track the matched ones by index
+        solution_identifier_attributes = [
+            [self._upper(attribute) for attribute in identifier.identifier_attributes]
+            for identifier in solution_identifiers
+        ]
+        matched = [False] * len(solution_identifiers)
+
         for src_identifier in src_identifiers:
-            solution_identifier, flag = self.validate_identifier_attributes(src_identifier,
-                                                                            unmatched_solution_identifiers)
+            unmatched = [index for index, is_matched in enumerate(matched) if not is_matched]
+            solution_identifier, flag = self.validate_identifier_attributes(
+                src_identifier,
+                [solution_identifiers[index] for index in unmatched],
+                [solution_identifier_attributes[index] for index in unmatched]
+            )
             if flag:
-                unmatched_solution_identifiers.remove(solution_identifier)
+                matched[solution_identifiers.index(solution_identifier)] = True
                 if solution_identifier.is_primary != src_identifier.is_primary:
-                    self.error_log.add_error("Identifier", src_table_id, src_identifier.id, "Error",f"Table {self.src_model.get_table_name_by_id(src_table_id)} identifier {src_identifier.name} primary property mismatch")
+                    self.error_log.add_error("Identifier", src_table_id, src_identifier.id, "Error","Table {} identifier {} primary property mismatch", self.src_model.get_table_name_by_id(src_table_id), src_identifier.name)
                     break
             #else:
                 #self.error_log.add_error("Identifier", src_table_id, src_identifier.id, "Error", f"Table {self.src_model.get_table_name_by_id(src_table_id)} identifier {src_identifier.name} not found in solution model")
 
-        if unmatched_solution_identifiers:
-            for identifier in unmatched_solution_identifiers:
-                self.error_log.add_error("Identifier", src_table_id, None, "Error",f"Unmatched identifier in entity {self.src_model.get_table_name_by_id(src_table_id)}: {identifier.name}")
+        for identifier, is_matched in zip(solution_identifiers, matched):
+            if not is_matched:
+                self.error_log.add_error("Identifier", src_table_id, None, "Error","Unmatched identifier in entity {}: {}", self.src_model.get_table_name_by_id(src_table_id), identifier.name)
 
-    def validate_relationship_entities(self, src_relationship, solution_relationship):
+    def _lowest_scores(self, src_items, solution_items, *getters):
         """
-                Validate the entities of a relationship in the source model against the entities of a relationship in the solution model.
+                Score the items in the source model against the items in the solution model on several names at once.
+                The score of a pair is the lowest of its name scores.
 
-                :param src_relationship: The relationship in the source model.
-                :param solution_relationship: The relationship in the solution model.
+                :param src_items: The items in the source model.
+                :param solution_items: The items in the solution model.
+                :param getters: Functions that return the named objects to compare from an item.
+                :return: The scores, row i holds the scores of src_items[i].
         """
+        matrices = [
+            self.wm.score_matrix([self._upper(getter(item)) for item in src_items],
+                                 [self._upper(getter(item)) for item in solution_items], normalized=True)
+            for getter in getters
+        ]
+        return [[min(scores) for scores in zip(*rows)] for rows in zip(*matrices)]
 
-        solution_entity_match, score = self.wm.compare_word(src_relationship.entity1.name,
-                                                            [solution_relationship.entity1.name])
-        solution_entity_match2, score2 = self.wm.compare_word(src_relationship.entity2.name,
-                                                              [solution_relationship.entity2.name])
-
-        solution_relationship_match_name, name_score = self.wm.compare_word(src_relationship.name,
-                                                                            [solution_relationship.name])
+    def _relationship_key(self, relationship):
+        """
+                Get the exact match key of a relationship.
 
-        if score > self.name_match_threshold and score2 > self.name_match_threshold and name_score > self.name_match_threshold:
-            return True
+                :param relationship: The relationship.
+                :return: The upper case names of both entities and of the relationship.
+        """
+        return self._upper(relationship.entity1), self._upper(relationship.entity2), self._upper(relationship)
 
     def validate_relationships(self):
         """
                 Validate the relationships in the source model against the relationships in the solution model.
         """
-        unmatched_sol_relationships = set(self.solution_model.relationships)
-
-        for src_relationship in self.src_model.relationships:
-            for sol_relationship in unmatched_sol_relationships:
-                if self.validate_relationship_entities(src_relationship, sol_relationship):
-                    unmatched_sol_relationships.remove(sol_relationship)
+        src_relationships = self.src_model.relationships
+        solution_relationships = self.solution_model.relationships
+
+        # relationships with the same entity names and name are paired without scoring them
+        solution_by_key = {}
+        for index, relationship in enumerate(solution_relationships):
+            solution_by_key.setdefault(self._relationship_key(relationship), []).append(index)
+        pairs = []
+        for src_relationship in src_relationships:
+            indexes = solution_by_key.get(self._relationship_key(src_relationship))
+            pairs.append((indexes.pop(0), 1.0) if indexes else None)
+
+        # the rest is scored, both entity names and the relationship name have to be above the threshold
+        src_rest = [i for i, pair in enumerate(pairs) if pair is None]
+        paired = {pair[0] for pair in pairs if pair is not None}
+        solution_rest = [j for j in range(len(solution_relationships)) if j not in paired]
+        scores = self._lowest_scores([src_relationships[i] for i in src_rest],
+                                     [solution_relationships[j] for j in solution_rest],
+                                     attrgetter("entity1"), attrgetter("entity2"), lambda relationship: relationship)
+        for i, (index, score) in zip(src_rest, self._assign(scores)):
+            pairs[i] = (solution_rest[index] if index >= 0 else -1, score)
+        matched = [False] * len(solution_relationships)
+
+        for src_relationship, (index, score) in zip(src_relationships, pairs):
+            if score > self.name_match_threshold:
+                matched[index] = True
+                sol_relationship = solution_relationships[index]
 
-                    if src_relationship.cardinality_1to2 != sol_relationship.cardinality_1to2 or src_relationship.cardinality_2to1 != sol_relationship.cardinality_2to1:
-                        self.error_log.add_error("Relationship", src_relationship.id, src_relationship.name, "Error",
-                                                 f"Relationship {src_relationship.name} cardinality mismatch")
+                if src_relationship.cardinality_1to2 != sol_relationship.cardinality_1to2 or src_relationship.cardinality_2to1 != sol_relationship.cardinality_2to1:
+                    self.error_log.add_error("Relationship", src_relationship.id, src_relationship.name, "Error",
+                                             "Relationship {} cardinality mismatch", src_relationship.name)
 
-                    if src_relationship.is_dependent_e1 != sol_relationship.is_dependent_e1 or src_relationship.is_dependent_e2 != sol_relationship.is_dependent_e2:
-                        self.error_log.add_error("Relationship", src_relationship.id, src_relationship.name, "Error",
-                                                 f"Relationship {src_relationship.name} dependent property mismatch")
-                        break
-                    else:
-                        break
+                if src_relationship.is_dependent_e1 != sol_relationship.is_dependent_e1 or src_relationship.is_dependent_e2 != sol_relationship.is_dependent_e2:
+                    self.error_log.add_error("Relationship", src_relationship.id, src_relationship.name, "Error",
+                                             "Relationship {} dependent property mismatch", src_relationship.name)
             else:
                 self.error_log.add_error("Relationship", src_relationship.id, src_relationship.name, "Error",
-                                         f"Relationship {src_relationship.name} not found in solution model")
+                                         "Relationship {} not found in solution model", src_relationship.name)
 
-        if unmatched_sol_relationships:
-            for relationship in unmatched_sol_relationships:
+        for relationship, is_matched in zip(solution_relationships, matched):
+            if not is_matched:
                 self.error_log.add_error("Relationship", None, None, "Error",
-                                         f"Unmatched relationship in solution model: {relationship.name}")
+                                         "Unmatched relationship in solution model: {}", relationship.name)
 
     def validate_inheritance(self, src_inheritance, solution_inheritance):
         """
@@ -271,37 +430,35 @@ class Validation:
         """
 
         # compare the names of the inheritance and the parent entity
-        parent_match, parent_score = self.wm.compare_word(src_inheritance.parent.name,
-                                                          [solution_inheritance.parent.name])
+        parent_match, parent_score = self.wm.compare_word(self._upper(src_inheritance.parent),
+                                                          [self._upper(solution_inheritance.parent)], normalized=True)
 
         # compare the names of the children entities
-        children_scores = []
-        for child in src_inheritance.children:
-            best_child_match, best_child_score = "", 0
-            for solution_child in solution_inheritance.children:
-                curr_match, curr_score = self.wm.compare_word(child.name, [solution_child.name])
-                if curr_score > best_child_score:
-                    best_child_match, best_child_score = curr_match, curr_score
-            children_scores.append([best_child_match, best_child_score])
-
-        if any(x[1] < self.name_match_threshold for x in children_scores):
+        children_scores = [
+            max(scores, default=0.0)
+            for scores in self.wm.score_matrix([self._upper(child) for child in src_inheritance.children],
+                                               [self._upper(child) for child in solution_inheritance.children],
+                                               normalized=True)
+        ]
+
+        if any(score < self.name_match_threshold for score in children_scores):
             error_info = ["Inheritance", src_inheritance.id, src_inheritance.name, "Error",
-                          f"Inheritance {src_inheritance.name} children mismatch"]
+                          "Inheritance {} children mismatch", src_inheritance.name]
             return error_info, False
 
         if parent_score < self.name_match_threshold:
             error_info = ["Inheritance", src_inheritance.id, src_inheritance.name, "Error",
-                          f"Inheritance {src_inheritance.name} parent mismatch"]
+                          "Inheritance {} parent mismatch", src_inheritance.name]
             return error_info, False
 
         if src_inheritance.mutually_exclusive != solution_inheritance.mutually_exclusive:
             self.error_log.add_error("Inheritance", src_inheritance.id, src_inheritance.name, "Error",
-                                     f"Inheritance {src_inheritance.name} mutually exclusive property mismatch")
+                                     "Inheritance {} mutually exclusive property mismatch", src_inheritance.name)
             return None, True
 
         if src_inheritance.complete != solution_inheritance.complete:
             self.error_log.add_error("Inheritance", src_inheritance.id, src_inheritance.name, "Error",
-                                     f"Inheritance {src_inheritance.name} complete property mismatch")
+                                     "Inheritance {} complete property mismatch", src_inheritance.name)
             return None, True
 
         return None, True
@@ -323,12 +480,12 @@ class Validation:
 
                 else:
                     self.error_log.add_error("Inheritance", src_inheritance.id, src_inheritance.name, "Error",
-                                             f"Inheritance {src_inheritance.name} not found in solution model")
+                                             "Inheritance {} not found in solution model", src_inheritance.name)
 
         if unmatched_sol_inheritances:
             for inheritance in unmatched_sol_inheritances:
                 self.error_log.add_error("Inheritance", None, None, "Error",
-                                         f"Unmatched inheritance in solution model: {inheritance.name}")
+                                         "Unmatched inheritance in solution model: {}", inheritance.name)
 
     def validate_association(self, src_association, solution_association):
         """
@@ -341,17 +498,15 @@ class Validation:
                 src_association.attributes) == 0:
             return True
 
-        attribute_scores = []
-        for src_attribute in src_association.attributes:
-            # get the most similar attribute name from the solution model
-            for solution_attribute in solution_association.attributes:
-                solution_attribute_match_name, score = self.wm.compare_word(src_attribute.name,
-                                                                            [solution_attribute.name])
-                attribute_scores.append([score, src_attribute.name])
+        # score every source attribute name against every solution attribute name
+        attribute_scores = self.wm.score_matrix([self._upper(attribute) for attribute in src_association.attributes],
+                                                [self._upper(attribute) for attribute in
+                                                 solution_association.attributes],
+                                                normalized=True)
 
-        if all(x[0] < self.name_match_threshold for x in attribute_scores):
+        if all(score < self.name_match_threshold for scores in attribute_scores for score in scores):
             self.error_log.add_error("Association", src_association.id, src_association.name, "Error",
-                                     f"Association attributes mismatch")
+                                     "Association attributes mismatch")
 
             return False
 
@@ -360,63 +515,54 @@ class Validation:
                 Validate the associations in the source model against the associations in the solution model.
         """
         src_entity_associations = self.src_model.associations
-        solution_entity_associations = set(self.solution_model.associations)
-
-        for src_entity_association in src_entity_associations:
-            for solution_entity_association in solution_entity_associations:
-                name_match, name_score = self.wm.compare_word(src_entity_association.name,
-                                                              [solution_entity_association.name])
-                if name_score > self.name_match_threshold:
-                    if self.validate_association(src_entity_association, solution_entity_association):
-                        solution_entity_associations.remove(solution_entity_association)
+        solution_entity_associations = self.solution_model.associations
+
+        name_scores = self.wm.score_matrix([self._upper(association) for association in src_entity_associations],
+                                           [self._upper(association) for association in solution_entity_associations],
+                                           normalized=True)
+        matched = [False] * len(solution_entity_associations)
+
+        for src_entity_association, association_scores in zip(src_entity_associations, name_scores):
+            for index, name_score in enumerate(association_scores):
+                if name_score > self.name_match_threshold and not matched[index]:
+                    if self.validate_association(src_entity_association, solution_entity_associations[index]):
+                        matched[index] = True
                         break
             else:
                 self.error_log.add_error("Association", src_entity_association.id, src_entity_association.name, "Error",
-                                         f"Association {src_entity_association.name} not found in solution model")
-        if solution_entity_associations:
-            for association in solution_entity_associations:
-                self.error_log.add_error("Association", None, None, "Error",
-                                         f"Unmatched association in solution model: {association.name}")
+                                         "Association {} not found in solution model", src_entity_association.name)
 
-    def validate_association_link(self, src_link, solution_link):
-        """
-                Validate an association link in the source model against an association link in the solution model.
-
-                :param src_link: The association link in the source model.
-                :param solution_link: The association link in the solution model.
-        """
-        solution_entity_match, score = self.wm.compare_word(src_link.association.name, [solution_link.association.name])
-        solution_entity_match2, score2 = self.wm.compare_word(src_link.entity.name, [solution_link.entity.name])
-        if score > self.name_match_threshold and score2 > self.name_match_threshold:
-            return True
-        return False
+        for association, is_matched in zip(solution_entity_associations, matched):
+            if not is_matched:
+                self.error_log.add_error("Association", None, None, "Error",
+                                         "Unmatched association in solution model: {}", association.name)
 
     def validate_association_links(self):
         """
                 Validate the association links in the source model against the association links in the solution model.
         """
         src_links = self.src_model.association_links
-        solution_links = set(self.solution_model.association_links)
-
-        for src_link in src_links:
-            for solution_link in solution_links:
-                # validate the association link entities and cardinality
-                if self.validate_association_link(src_link, solution_link):
-                    solution_links.remove(solution_link)
-                    if src_link.cardinality == solution_link.cardinality:
-                        break
-                    else:
-                        self.error_log.add_error("Association Link", src_link.id, src_link.association, "Error",
-                                                 f"Association link {src_link.association, src_link.entity} cardinality mismatch")
+        solution_links = self.solution_model.association_links
 
+        # both the association and the entity name have to be above the threshold
+        scores = self._lowest_scores(src_links, solution_links, attrgetter("association"), attrgetter("entity"))
+        matched = [False] * len(solution_links)
+
+        for src_link, (index, score) in zip(src_links, self._assign(scores)):
+            # validate the association link entities and cardinality
+            if score > self.name_match_threshold:
+                matched[index] = True
+                if src_link.cardinality != solution_links[index].cardinality:
+                    self.error_log.add_error("Association Link", src_link.id, src_link.association, "Error",
+                                             "Association link {} cardinality mismatch", (src_link.association, src_link.entity))
             else:
                 self.error_log.add_error("Association Link", src_link.id, src_link.association, "Error",
-                                         f"Association link {src_link.association, src_link.entity} not found in solution model")
+                                         "Association link {} not found in solution model", (src_link.association, src_link.entity))
 
-        if solution_links:
-            for link in solution_links:
+        for link, is_matched in zip(solution_links, matched):
+            if not is_matched:
                 self.error_log.add_error("Association Link", None, None, "Error",
-                                         f"Unmatched association link in solution model: {link.association, link.entity}")
+                                         "Unmatched association link in solution model: {}", (link.association, link.entity))
 
 
 if __name__ == '__main__':
@@ -1,49 +1,318 @@
 # uses levenshtein distance to compare two words and return the most similar word
 # the similarity score is calculated as 1 - (levenshtein_distance / max_len)
 # is not case sensitive
+# without rapidfuzz the distance calculation gives up once the words can no longer reach the match threshold,
+# scores below the threshold are then only guaranteed to stay below it
+# rapidfuzz is used for the comparison when it is installed, otherwise the pure python implementation below is used
+from array import array
+from collections import Counter
+from functools import lru_cache
+
+try:
+    from rapidfuzz import process as _rf_process
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:
+    _rf_process = None
+
+# process.cdist returns a numpy matrix, so it is only used when numpy is installed as well
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# without rapidfuzz the distance is calculated by a numba compiled kernel when numba is installed
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+if _numba is not None and _np is not None:
+    @_numba.njit(cache=True, boundscheck=False)
+    def _lev_numba(a, b, max_distance):
+        if a.shape[0] < b.shape[0]:
+            a, b = b, a
+        n = b.shape[0]
+        if n == 0:
+            return a.shape[0]
+
+        previous_row = _np.empty(n + 1, dtype=_np.int32)
+        current_row = _np.empty(n + 1, dtype=_np.int32)
+        for j in range(n + 1):
+            previous_row[j] = j
+        for i in range(a.shape[0]):
+            current_row[0] = i + 1
+            row_min = i + 1
+            for j in range(n):
+                distance = previous_row[j] + (a[i] != b[j])
+                if previous_row[j + 1] + 1 < distance:
+                    distance = previous_row[j + 1] + 1
+                if current_row[j] + 1 < distance:
+                    distance = current_row[j] + 1
+                current_row[j + 1] = distance
+                if distance < row_min:
+                    row_min = distance
+            if row_min > max_distance:
+                return max_distance + 1
+            previous_row, current_row = current_row, previous_row
+        return previous_row[n]
+
+    # word i of a packed word list is buffer[offsets[i]:offsets[i + 1]]
+    @_numba.njit(cache=True, boundscheck=False)
+    def _score_matrix_numba(src_buffer, src_offsets, sol_buffer, sol_offsets, name_match_threshold):
+        rows = src_offsets.shape[0] - 1
+        columns = sol_offsets.shape[0] - 1
+        scores = _np.empty((rows, columns), dtype=_np.float64)
+        for i in range(rows):
+            a = src_buffer[src_offsets[i]:src_offsets[i + 1]]
+            for j in range(columns):
+                b = sol_buffer[sol_offsets[j]:sol_offsets[j + 1]]
+                max_len = max(a.shape[0], b.shape[0])
+                if max_len == 0:
+                    scores[i, j] = 1.0
+                    continue
+                max_distance = int((1 - name_match_threshold) * max_len) + 1
+                if abs(a.shape[0] - b.shape[0]) > max_distance:
+                    distance = max_distance + 1
+                else:
+                    distance = _lev_numba(a, b, max_distance)
+                scores[i, j] = 1 - distance / max_len
+        return scores
+
+    # code points rather than utf-8 bytes, so a letter like č still counts as a single edit
+    @lru_cache(maxsize=1 << 12)
+    def _code_points(word):
+        return _np.frombuffer(word.encode("utf-32-le"), dtype=_np.uint32)
+
+    # pack a word list into one contiguous code point buffer and the offsets of the words in it
+    def _pack(words):
+        offsets = _np.zeros(len(words) + 1, dtype=_np.int64)
+        _np.cumsum([len(word) for word in words], out=offsets[1:])
+        return _np.frombuffer("".join(words).encode("utf-32-le"), dtype=_np.uint32), offsets
+else:
+    _lev_numba = None
+    _score_matrix_numba = None
+
+# character counts for the bag distance prefilter, the same names are compared over and over
+_char_counts = lru_cache(maxsize=1 << 12)(Counter)
+
+# bit-parallel levenshtein distance of Myers and Hyyrö, each row of the DP is held in the bits of two integers
+# meant for words of up to 64 characters, where python keeps the bit vectors in a single machine word
+# https://doi.org/10.1145/316542.316550
+# returns max_distance + 1 as soon as the distance is known to exceed max_distance
+def myers64(pattern: str, text: str, max_distance: int = None) -> int:
+    if not pattern:
+        return len(text)
+    if max_distance is None:
+        max_distance = max(len(pattern), len(text))
+
+    # bit i of peq[c] is set when pattern[i] == c
+    peq = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    mask = (1 << len(pattern)) - 1
+    last = 1 << (len(pattern) - 1)
+    pv, mv = mask, 0
+    score = len(pattern)
+    remaining = len(text)
+    for c in text:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        # each remaining character of the text lowers the score by at most one
+        remaining -= 1
+        if score - remaining > max_distance:
+            return max_distance + 1
+    return score
+
+
+# the pure python comparison searches a trie of the solution words when there are at least this many of them
+_TRIE_MIN_WORDS = 8
+# key of the word indexes in a trie node, it can not clash with the single character keys
+_END = ""
+
+
+# finds the words within a levenshtein distance of a word, the trie shares the rows of the common prefixes
+# http://stevehanov.ca/blog/?id=114
+class TrieLevenshtein:
+    def __init__(self, words: list[str]):
+        self.root = {}
+        self.longest = 0
+        for index, word in enumerate(words):
+            node = self.root
+            for char in word:
+                node = node.setdefault(char, {})
+            node.setdefault(_END, []).append(index)
+            self.longest = max(self.longest, len(word))
+
+    # returns the index and distance of the words within max_distance of word
+    def search(self, word: str, max_distance: int) -> dict[int, int]:
+        first_row = list(range(len(word) + 1))
+        results = {index: first_row[-1] for index in self.root.get(_END, ()) if first_row[-1] <= max_distance}
+
+        stack = [(char, node, first_row) for char, node in self.root.items() if char != _END]
+        while stack:
+            char, node, previous_row = stack.pop()
+            current_row = [previous_row[0] + 1]
+            for j, c in enumerate(word):
+                current_row.append(min(current_row[j] + 1, previous_row[j + 1] + 1, previous_row[j] + (c != char)))
+
+            distance = current_row[-1]
+            if distance <= max_distance:
+                for index in node.get(_END, ()):
+                    results[index] = distance
+            # the minimum of a row never decreases in the rows below it, so the subtree can be skipped
+            if min(current_row) <= max_distance:
+                stack.extend((next_char, next_node, current_row)
+                             for next_char, next_node in node.items() if next_char != _END)
+        return results
+
+
 class WordMatch:
-    def __init__(self):
-        pass
+    def __init__(self, name_match_threshold: float = 0.85):
+        self.name_match_threshold = name_match_threshold
+        # scores of upper case word pairs, the same names are compared in many validations
+        self._score = lru_cache(maxsize=1 << 17)(self.similarity_score)
 
     # https://en.wikipedia.org/wiki/Levenshtein_distance
-    def levenshtein_distance(self, s1, s2):
+    # returns max_distance + 1 as soon as the distance is known to exceed max_distance
+    def levenshtein_distance(self, s1, s2, max_distance=None):
+        if _lev_numba is not None:
+            if max_distance is None:
+                max_distance = max(len(s1), len(s2))
+            return int(_lev_numba(_code_points(s1), _code_points(s2), max_distance))
+
         if len(s1) < len(s2):
-            return self.levenshtein_distance(s2, s1)
+            return self.levenshtein_distance(s2, s1, max_distance)
 
         # len(s1) >= len(s2)
         if len(s2) == 0:
             return len(s1)
+        if len(s1) <= 64:
+            return myers64(s2, s1, max_distance)
+        if max_distance is None:
+            max_distance = len(s1)
 
-        previous_row = range(len(s2) + 1)
+        # two rows are reused for the whole calculation, the minimum of a row never decreases in the next one
+        previous_row = array('i', range(len(s2) + 1))
+        current_row = array('i', previous_row)
         for i, c1 in enumerate(s1):
-            current_row = [i + 1]
+            current_row[0] = i + 1
             for j, c2 in enumerate(s2):
                 insertions = previous_row[j + 1] + 1
                 deletions = current_row[j] + 1
                 substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
+                current_row[j + 1] = min(insertions, deletions, substitutions)
+            if min(current_row) > max_distance:
+                return max_distance + 1
+            previous_row, current_row = current_row, previous_row
 
         return previous_row[-1]
 
-    def similarity_score(self   , s1, s2):
-        lev_distance = self.levenshtein_distance(s1, s2)
-        max_len = max(len(s1), len(s2))
-        if max_len == 0:
+    def similarity_score(self, s1, s2):
+        if s1 == s2:
             return 1.0
+        max_len = max(len(s1), len(s2))
+        # one edit of slack keeps float rounding from changing a comparison against the threshold
+        max_distance = int((1 - self.name_match_threshold) * max_len) + 1
+
+        # the length difference and the bag distance are cheap lower bounds of the levenshtein distance
+        if abs(len(s1) - len(s2)) > max_distance:
+            return 1 - (max_distance + 1) / max_len
+        counts1 = _char_counts(s1)
+        counts2 = _char_counts(s2)
+        if max(sum((counts1 - counts2).values()), sum((counts2 - counts1).values())) > max_distance:
+            return 1 - (max_distance + 1) / max_len
+
+        lev_distance = self.levenshtein_distance(s1, s2, max_distance)
         return 1 - lev_distance / max_len
 
     # comare the source word with the solution words and return the most similar word score
-    def compare_word(self, src_w: str, sol_words: list[str]) -> list[str | float]:
+    # normalized tells that the words are already upper case
+    def compare_word(self, src_w: str, sol_words: list[str], normalized: bool = False) -> list[str | float]:
+        src_upper = src_w if normalized else src_w.upper()
+        sol_upper = sol_words if normalized else [sol_word.upper() for sol_word in sol_words]
+
+        # an exact match always has the best score, nothing has to be scored for it
+        if src_upper in sol_upper:
+            return [sol_words[sol_upper.index(src_upper)], 1.0]
+
+        if _rf_process is not None:
+            # extractOne keeps the first of equally scored words, same as the stable sort below
+            match = _rf_process.extractOne(src_upper, sol_upper, scorer=_rf_levenshtein.normalized_similarity,
+                                           processor=None)
+            if match is None:
+                return [src_w, 0.0]
+            return [sol_words[match[2]], match[1]]
+
+        if _lev_numba is None and len(sol_upper) >= _TRIE_MIN_WORDS:
+            scores = self._trie_scores(src_upper, TrieLevenshtein(sol_upper), sol_upper)
+        else:
+            scores = [self._score(src_upper, sol_word_upper) for sol_word_upper in sol_upper]
+
         results_table = []
-        for sol_word in sol_words:
-            score = self.similarity_score(src_w.upper(), sol_word.upper())
+        for sol_word, score in zip(sol_words, scores):
             results_table.append([sol_word, score])
 
         if len(results_table) == 0:
             return [src_w, 0.0]
         return sorted(results_table, key=lambda x: x[1], reverse=True)[0]
 
+    # compare every source word with every solution word, row i holds the scores of src_words[i]
+    def score_matrix(self, src_words: list[str], sol_words: list[str],
+                     normalized: bool = False) -> list[list[float]]:
+        if not src_words or not sol_words:
+            return [[] for _ in src_words]
+
+        if _rf_process is not None and _np is not None:
+            return _rf_process.cdist(src_words, sol_words, scorer=_rf_levenshtein.normalized_similarity,
+                                     processor=None if normalized else str.upper, dtype=_np.float64,
+                                     workers=-1).tolist()
+
+        src_upper = src_words if normalized else [src_word.upper() for src_word in src_words]
+        sol_upper = sol_words if normalized else [sol_word.upper() for sol_word in sol_words]
+        if _score_matrix_numba is not None:
+            return _score_matrix_numba(*_pack(src_upper), *_pack(sol_upper), self.name_match_threshold).tolist()
+
+        if len(sol_upper) >= _TRIE_MIN_WORDS:
+            trie = TrieLevenshtein(sol_upper)
+            return [self._trie_scores(src_word, trie, sol_upper) for src_word in src_upper]
+
+        score = self._score
+        return [[score(src_word, sol_word) for sol_word in sol_upper] for src_word in src_upper]
+
+    # score src_w against the words of the trie built from sol_words, with the same results as similarity_score
+    def _trie_scores(self, src_w: str, trie: TrieLevenshtein, sol_words: list[str]) -> list[float]:
+        threshold = self.name_match_threshold
+        hits = trie.search(src_w, int((1 - threshold) * max(len(src_w), trie.longest)) + 1)
+
+        scores = []
+        for index, sol_word in enumerate(sol_words):
+            max_len = max(len(src_w), len(sol_word))
+            if max_len == 0:
+                scores.append(1.0)
+                continue
+            max_distance = int((1 - threshold) * max_len) + 1
+            distance = hits.get(index, max_distance + 1)
+            scores.append(1 - min(distance, max_distance + 1) / max_len)
+        return scores
+
+
+# WordMatch keeps no state of a single validation, so the instances and their score caches are shared
+@lru_cache(maxsize=None)
+def shared(name_match_threshold: float = 0.85) -> WordMatch:
+    return WordMatch(name_match_threshold)
+
 
 if __name__ == '__main__':
     wm = WordMatch()